@@ -13,9 +13,32 @@ import hashlib
 import logging
 import os
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, Optional, Tuple
 from pathlib import Path
 
+# Faster JSONL read/write when orjson is installed. _hash_dict keeps using json
+# so args/result hashes do not depend on which library is present.
+# Entry timestamps are naive UTC datetimes, written as ISO 8601 with a "Z" suffix.
+try:
+    import orjson
+
+    _ENTRY_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
+    def _dumps_entry(entry: Dict[str, Any]) -> str:
+        return orjson.dumps(entry, option=_ENTRY_OPTIONS).decode()
+
+    _loads_entry = orjson.loads
+except ImportError:
+    def _utc_isoformat(obj: Any) -> str:
+        if isinstance(obj, datetime):
+            return obj.isoformat() + "Z"
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    def _dumps_entry(entry: Dict[str, Any]) -> str:
+        return json.dumps(entry, default=_utc_isoformat)
+
+    _loads_entry = json.loads
+
 
 class AuditLogger:
     """
@@ -42,6 +65,8 @@ class AuditLogger:
         """
         self.audit_file = audit_file
         self.logger = logging.getLogger(logger_name)
+        # agent_id -> (audit file signature, stats); reused until the file changes
+        self._stats_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
         
         if self.audit_file:
             os.makedirs(os.path.dirname(os.path.abspath(self.audit_file)), exist_ok=True)
@@ -73,7 +98,7 @@ class AuditLogger:
         result_hash = self._hash_dict(result)
         
         log_entry = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": datetime.utcnow(),
             "agent_id": agent_id,
             "call_id": call_id,
             "tool": tool,
@@ -109,7 +134,7 @@ class AuditLogger:
             details: Event-specific details
         """
         log_entry = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": datetime.utcnow(),
             "agent_id": agent_id,
             "call_id": call_id,
             "type": event_type,
@@ -138,7 +163,7 @@ class AuditLogger:
             reason: Why it was denied (e.g., "rate_limit_exceeded")
         """
         log_entry = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": datetime.utcnow(),
             "agent_id": agent_id,
             "call_id": call_id,
             "tool": tool,
@@ -163,37 +188,74 @@ class AuditLogger:
         
         try:
             with open(self.audit_file, 'a') as f:
-                f.write(json.dumps(entry) + '\n')
+                f.write(_dumps_entry(entry) + '\n')
         except IOError as e:
             self.logger.error(f"Failed to write audit entry: {e}")
 
-    def load_audit_log(self) -> list:
-        """Load and parse all audit log entries."""
+    def iter_audit_log(self) -> Iterator[Dict[str, Any]]:
+        """Yield parsed audit log entries one at a time, without loading the whole file."""
         if not self.audit_file or not os.path.exists(self.audit_file):
-            return []
+            return
         
-        entries = []
         try:
             with open(self.audit_file, 'r') as f:
                 for line in f:
                     if line.strip():
-                        entries.append(json.loads(line))
-            return entries
+                        yield _loads_entry(line)
         except IOError as e:
             self.logger.error(f"Failed to read audit log: {e}")
-            return []
+
+    def load_audit_log(self) -> list:
+        """Load and parse all audit log entries."""
+        return list(self.iter_audit_log())
+
+    def _file_signature(self) -> Optional[Tuple[int, int]]:
+        """Return (size, mtime_ns) of the audit file, or None if it does not exist."""
+        if not self.audit_file:
+            return None
+        try:
+            st = os.stat(self.audit_file)
+        except OSError:
+            return None
+        return (st.st_size, st.st_mtime_ns)
 
     def get_agent_stats(self, agent_id: str) -> Dict[str, Any]:
-        """Get statistics for a specific agent from audit log."""
-        entries = self.load_audit_log()
-        agent_entries = [e for e in entries if e.get("agent_id") == agent_id]
+        """
+        Get statistics for a specific agent from audit log.
         
-        total_calls = len([e for e in agent_entries if "tool" in e])
-        successful = len([e for e in agent_entries if e.get("status") == "success"])
-        failed = len([e for e in agent_entries if e.get("status") == "error"])
-        denied = len([e for e in agent_entries if e.get("event_type") == "permission_denied"])
+        Results are cached per agent and recomputed only when the audit file
+        has changed since they were computed.
+        """
+        signature = self._file_signature()
+        cached = self._stats_cache.get(agent_id)
+        if signature is not None and cached is not None and cached[0] == signature:
+            return dict(cached[1])
+
+        stats = self._compute_agent_stats(agent_id)
+        if signature is not None:
+            self._stats_cache[agent_id] = (signature, stats)
+        return dict(stats)
+
+    def _compute_agent_stats(self, agent_id: str) -> Dict[str, Any]:
+        """Compute statistics for a specific agent by reading the audit log."""
+        total_calls = successful = failed = denied = 0
+        total_time = 0
         
-        total_time = sum(e.get("duration_ms", 0) for e in agent_entries if "duration_ms" in e)
+        # Single pass over the log; no per-agent list is built
+        for e in self.iter_audit_log():
+            if e.get("agent_id") != agent_id:
+                continue
+            if "tool" in e:
+                total_calls += 1
+            status = e.get("status")
+            if status == "success":
+                successful += 1
+            elif status == "error":
+                failed += 1
+            if e.get("event_type") == "permission_denied":
+                denied += 1
+            if "duration_ms" in e:
+                total_time += e["duration_ms"]
         
         return {
             "agent_id": agent_id,
@@ -297,6 +297,28 @@ class EngineCore:
         }
 
 
+def run_event_loop(coro):
+    """
+    Run a coroutine to completion on uvloop when it is installed.
+
+    Falls back to the default asyncio loop without uvloop.
+
+    Args:
+        coro: Coroutine to run (e.g. an application's main())
+
+    Returns:
+        The coroutine's result
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    if hasattr(uvloop, "run"):
+        return uvloop.run(coro)
+    uvloop.install()
+    return asyncio.run(coro)
+
+
 def main():
     """CLI entry point."""
     import argparse
@@ -311,7 +333,7 @@ def main():
     core = EngineCore(policy_path=args.policy)
     
     try:
-        asyncio.run(core.run(host=args.host, port=args.port))
+        run_event_loop(core.run(host=args.host, port=args.port))
     except KeyboardInterrupt:
         logger.info("Shutting down ANSE engine")
 
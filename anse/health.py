@@ -23,6 +23,14 @@ class HealthMonitor:
         self.last_event_time: Optional[float] = None
         self.event_count = 0
         self.process = psutil.Process()
+        # Fields that cannot change while the process runs, built once
+        self._static_status = {
+            "version": "0.1.0",
+            "platform": platform.system(),
+            "python_version": platform.python_version(),
+        }
+        # Prime the CPU counter so get_status() can read it without sleeping
+        self.process.cpu_percent(interval=None)
 
     def record_event(self, event_type: str = "call"):
         """Record that an event occurred."""
@@ -46,16 +54,16 @@ class HealthMonitor:
         """Return current health status as JSON-serializable dict."""
         uptime_seconds = time.time() - self.start_time
         memory_info = self.process.memory_info()
-        cpu_percent = self.process.cpu_percent(interval=0.1)
+        # Usage since the previous call; a sampling interval here would block
+        # the event loop of whatever is serving the health request
+        cpu_percent = self.process.cpu_percent(interval=None)
 
         return {
             "status": "running",
             "uptime_seconds": int(uptime_seconds),
             "uptime_readable": self._format_uptime(uptime_seconds),
             "timestamp": datetime.utcnow().isoformat(),
-            "version": "0.1.0",
-            "platform": platform.system(),
-            "python_version": platform.python_version(),
+            **self._static_status,
             "memory_mb": round(memory_info.rss / (1024 * 1024), 1),
             "cpu_percent": round(cpu_percent, 1),
             "event_count": self.event_count,
@@ -5,16 +5,68 @@ import json
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 # Import operator-ui components
 try:
     from operator_ui.app import create_app, db
     from operator_ui.models import AuditEvent, Agent
+    from sqlalchemy import text
     OPERATOR_UI_AVAILABLE = True
 except ImportError:
     OPERATOR_UI_AVAILABLE = False
 
+# Optional ASGI server for hosting the Flask app inside the engine's event loop
+try:
+    from asgiref.wsgi import WsgiToAsgi
+    from hypercorn.asyncio import serve as hypercorn_serve
+    from hypercorn.config import Config as HypercornConfig
+    ASGI_SERVER_AVAILABLE = True
+except ImportError:
+    ASGI_SERVER_AVAILABLE = False
+
+
+def read_audit_lines(audit_file: str, offset: int, limit: int) -> Tuple[List[Dict], int]:
+    """
+    Read complete audit JSONL entries written after a byte offset.
+
+    A trailing line without its newline is still being written and is left
+    for the next read. If the file is now shorter than the offset (truncated
+    or rotated), reading starts over from the beginning.
+
+    Args:
+        audit_file: Path to ANSE audit JSONL file
+        offset: Byte offset just past the last line already read
+        limit: Maximum entries to return
+
+    Returns:
+        (entries, offset just past the last line consumed)
+    """
+    if os.path.getsize(audit_file) < offset:
+        offset = 0
+
+    events = []
+    # Binary mode, so tell()/seek() are real byte offsets comparable to the file size
+    with open(audit_file, 'rb') as f:
+        f.seek(offset)
+
+        while len(events) < limit:
+            line = f.readline()
+            # Stop at EOF or at a line the engine is still writing
+            if not line.endswith(b'\n'):
+                break
+            offset = f.tell()
+
+            if not line.strip():
+                continue
+
+            try:
+                events.append(json.loads(line.decode('utf-8')))
+            except (UnicodeDecodeError, json.JSONDecodeError):
+                continue
+
+    return events, offset
+
 
 class OperatorUIBridge:
     """Bridge between ANSE engine and operator-ui database."""
@@ -30,6 +82,11 @@ class OperatorUIBridge:
         self.db_path = operator_ui_db_path or "operator_ui.db"
         self.app = None
         self.last_synced_event_id = 0
+        # Byte offset just past the last audit line synced; the next sync seeks
+        # here instead of re-reading (and re-inserting) the file from the top
+        self.last_synced_offset = 0
+        # Agent ids known to exist in the database, so repeat syncs skip the lookup
+        self._known_agent_ids = set()
 
     def initialize(self) -> bool:
         """Initialize Flask app and database."""
@@ -39,15 +96,25 @@ class OperatorUIBridge:
         config = {
             'SQLALCHEMY_DATABASE_URI': f'sqlite:///{self.db_path}',
             'SQLALCHEMY_TRACK_MODIFICATIONS': False,
+            # Wait for SQLite's writer lock instead of failing with "database is locked"
+            'SQLALCHEMY_ENGINE_OPTIONS': {'connect_args': {'timeout': 30}},
         }
 
         self.app = create_app(config)
+
+        # WAL lets the UI keep reading while audit syncs write. The mode is
+        # stored in the database file, so setting it once is enough.
+        with self.app.app_context():
+            db.session.execute(text('PRAGMA journal_mode=WAL'))
+            db.session.commit()
         return True
 
     def sync_audit_events(self, audit_file: str, limit: int = 100) -> int:
         """
         Sync ANSE audit log events to operator-ui database.
 
+        Each call resumes after the last line synced by the previous call.
+
         Args:
             audit_file: Path to ANSE audit JSONL file
             limit: Maximum events to sync in one call
@@ -61,42 +128,37 @@ class OperatorUIBridge:
         if not os.path.exists(audit_file):
             return 0
 
-        count = 0
         with self.app.app_context():
             try:
-                with open(audit_file, 'r') as f:
-                    for line in f:
-                        if not line.strip():
-                            continue
-
-                        try:
-                            event_data = json.loads(line)
-                            
-                            # Skip already-synced events (could use line number for efficiency)
-                            if count >= limit:
-                                break
-
-                            # Ensure agent exists
-                            agent_id = event_data.get('agent_id')
-                            if agent_id:
-                                agent = Agent.query.filter_by(id=agent_id).first()
-                                if not agent:
-                                    agent = Agent(
-                                        id=agent_id,
-                                        agent_type='unknown',
-                                        status='active'
-                                    )
-                                    db.session.add(agent)
-
-                            # Create audit event from ANSE log
-                            event = AuditEvent.from_audit_event(event_data)
-                            db.session.add(event)
-                            count += 1
-
-                        except json.JSONDecodeError:
-                            continue
+                events, offset = read_audit_lines(audit_file, self.last_synced_offset, limit)
+
+                # Ensure agents exist, with one query for the whole batch
+                # instead of one per event
+                agent_ids = {e.get('agent_id') for e in events} - {None, ''}
+                agent_ids -= self._known_agent_ids
+                if agent_ids:
+                    known = {
+                        agent.id
+                        for agent in Agent.query.filter(Agent.id.in_(agent_ids))
+                    }
+                    for agent_id in agent_ids - known:
+                        db.session.add(Agent(
+                            id=agent_id,
+                            agent_type='unknown',
+                            status='active'
+                        ))
+
+                # Create audit events from ANSE log; added as one batch so the
+                # flush can send them as a multi-row INSERT
+                db.session.add_all(
+                    [AuditEvent.from_audit_event(event_data) for event_data in events]
+                )
+                count = len(events)
 
                 db.session.commit()
+                self._known_agent_ids |= agent_ids
+                self.last_synced_offset = offset
+                self.last_synced_event_id += count
                 return count
 
             except Exception as e:
@@ -132,6 +194,7 @@ class OperatorUIBridge:
                     agent.status = 'active'
 
                 db.session.commit()
+                self._known_agent_ids.add(agent_id)
                 return True
 
             except Exception as e:
@@ -201,6 +264,31 @@ def serve_operator_ui(
     app.run(host=host, port=port, debug=debug)
 
 
+async def serve_operator_ui_async(host: str = "127.0.0.1", port: int = 5000) -> None:
+    """
+    Serve the operator-ui Flask app on the running event loop with hypercorn.
+
+    Requires asgiref and hypercorn (see ASGI_SERVER_AVAILABLE).
+
+    Args:
+        host: Host to bind to
+        port: Port to bind to
+    """
+    if not OPERATOR_UI_AVAILABLE:
+        print("Operator UI not available. Install operator_ui dependencies:")
+        print("  pip install -r operator_ui/requirements.txt")
+        return
+
+    config = HypercornConfig()
+    config.bind = [f"{host}:{port}"]
+
+    # Never-set event: Ctrl+C is left to the caller's event loop instead of
+    # hypercorn's own signal handlers, so the engine stops along with the UI
+    await hypercorn_serve(
+        WsgiToAsgi(create_app()), config, shutdown_trigger=asyncio.Event().wait
+    )
+
+
 if __name__ == "__main__":
     # CLI entry point
     import argparse
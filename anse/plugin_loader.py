@@ -23,6 +23,46 @@ import yaml
 logger = logging.getLogger(__name__)
 
 
+# Python plugin class -> {tool name: {"doc", "parameters"}}, filled on first registration
+_tool_specs: Dict[type, Dict[str, Dict[str, Any]]] = {}
+
+
+def _python_tool_specs(plugin_class: type) -> Dict[str, Dict[str, Any]]:
+    """Return tool metadata for a Python plugin class's public async methods.
+    
+    Signatures and docstrings are read once per class and reused for every
+    later instance and lookup of that class.
+    
+    Args:
+        plugin_class: Plugin class to inspect
+        
+    Returns:
+        Dict of {method_name: {"doc": docstring or None, "parameters": schema}}
+    """
+    specs = _tool_specs.get(plugin_class)
+    if specs is None:
+        specs = {}
+        for method_name, method in inspect.getmembers(plugin_class):
+            if method_name.startswith('_') or not inspect.iscoroutinefunction(method):
+                continue
+            
+            # Get method signature for parameters
+            sig = inspect.signature(method)
+            specs[method_name] = {
+                'doc': inspect.getdoc(method),
+                'parameters': {
+                    param: {
+                        'type': 'string',  # Default type
+                        'required': info.default == inspect.Parameter.empty
+                    }
+                    for param, info in sig.parameters.items()
+                    if param != 'self'
+                },
+            }
+        _tool_specs[plugin_class] = specs
+    return specs
+
+
 class PluginValidationError(Exception):
     """Raised when a plugin fails validation checks."""
     pass
@@ -327,40 +367,22 @@ class PluginLoader:
         sensitivity = getattr(instance, 'sensitivity', 'low')
         rate_limit = getattr(instance, 'rate_limit', 60)
         
-        # Find all public async methods to expose as tools
-        for method_name, method in inspect.getmembers(instance):
-            if method_name.startswith('_'):
-                continue
+        # Expose all public async methods as tools
+        for method_name, spec in _python_tool_specs(type(instance)).items():
+            # Build description from docstring
+            description = spec['doc'] or f"{method_name} from {plugin_name} plugin"
             
-            if inspect.iscoroutinefunction(method):
-                # Get method signature for parameters
-                sig = inspect.signature(method)
-                parameters = {
-                    param: {
-                        'type': 'string',  # Default type
-                        'required': param.default == inspect.Parameter.empty
-                    }
-                    for param in sig.parameters
-                    if param != 'self'
-                }
-                
-                # Build description from docstring
-                description = (
-                    inspect.getdoc(method) or 
-                    f"{method_name} from {plugin_name} plugin"
-                )
-                
-                # Register with engine
-                engine_core.register_tool(
-                    name=f"{plugin_name}_{method_name}",
-                    func=method,
-                    description=description,
-                    parameters=parameters,
-                    sensitivity=sensitivity,
-                    cost_hint={'latency_ms': 100}
-                )
-                
-                logger.debug(f"Registered Python tool: {plugin_name}_{method_name}")
+            # Register with engine
+            engine_core.register_tool(
+                name=f"{plugin_name}_{method_name}",
+                func=getattr(instance, method_name),
+                description=description,
+                parameters={param: dict(info) for param, info in spec['parameters'].items()},
+                sensitivity=sensitivity,
+                cost_hint={'latency_ms': 100}
+            )
+            
+            logger.debug(f"Registered Python tool: {plugin_name}_{method_name}")
     
     @staticmethod
     def _build_parameter_schema(parameters: Dict) -> Dict:
@@ -428,10 +450,7 @@ class PluginLoader:
         else:
             instance = info['instance']
             result['description'] = getattr(instance, 'description', '')
-            result['tools'] = [
-                name for name, method in inspect.getmembers(instance)
-                if inspect.iscoroutinefunction(method) and not name.startswith('_')
-            ]
+            result['tools'] = list(_python_tool_specs(type(instance)))
             result['tool_count'] = len(result['tools'])
         
         return result
@@ -13,6 +13,8 @@ class ToolRegistry:
 
     def __init__(self):
         self._tools: Dict[str, Dict[str, Any]] = {}
+        # list_tools() result, built on first use and dropped by register()
+        self._listing: Optional[Dict[str, Dict[str, Any]]] = None
 
     def register(
         self,
@@ -44,6 +46,7 @@ class ToolRegistry:
             "sensitivity": sensitivity,
             "cost_hint": cost_hint or {},
         }
+        self._listing = None
 
     def list_tools(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -52,15 +55,18 @@ class ToolRegistry:
         Returns:
             Dict mapping tool names to their metadata (excluding the func itself)
         """
-        return {
-            name: {
-                "description": tool["description"],
-                "schema": tool["schema"],
-                "sensitivity": tool["sensitivity"],
-                "cost_hint": tool["cost_hint"],
+        if self._listing is None:
+            self._listing = {
+                name: {
+                    "description": tool["description"],
+                    "schema": tool["schema"],
+                    "sensitivity": tool["sensitivity"],
+                    "cost_hint": tool["cost_hint"],
+                }
+                for name, tool in self._tools.items()
             }
-            for name, tool in self._tools.items()
-        }
+        # A fresh dict per call, so callers adding or removing entries leave the cache intact
+        return dict(self._listing)
 
     async def call(self, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -77,10 +83,10 @@ class ToolRegistry:
             KeyError: If tool not found
             Exception: Any error from tool execution
         """
-        if name not in self._tools:
+        tool = self._tools.get(name)
+        if tool is None:
             raise KeyError(f"Tool '{name}' not found")
 
-        tool = self._tools[name]
         return await tool["func"](**args)
 
     def has_tool(self, name: str) -> bool:
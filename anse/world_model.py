@@ -10,8 +10,9 @@ Features:
 import time
 import json
 import os
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 from collections import deque
+from itertools import islice
 from datetime import datetime
 
 
@@ -73,6 +74,14 @@ class WorldModel:
         except IOError as e:
             logger.error(f"Failed to persist event: {e}")
 
+    def _tail(self, n: int) -> Iterator[Dict[str, Any]]:
+        """Iterate over the last n events, oldest first, touching only those n."""
+        if n <= 0:
+            # Keep list slicing semantics for [-n:] with n <= 0
+            return iter(list(self.events)[-n:])
+        # Walk from the newest end, so cost follows n rather than the deque's length
+        return reversed(list(islice(reversed(self.events), n)))
+
     def get_recent(self, n: int = 10) -> List[Dict[str, Any]]:
         """
         Retrieve the N most recent events.
@@ -83,7 +92,7 @@ class WorldModel:
         Returns:
             List of event dictionaries, most recent last
         """
-        return list(self.events)[-n:]
+        return list(self._tail(n))
 
     def get_events_for_agent(self, agent_id: str, n: int = 10) -> List[Dict[str, Any]]:
         """
@@ -96,7 +105,7 @@ class WorldModel:
         Returns:
             List of events matching agent_id, most recent last
         """
-        return [e for e in list(self.events)[-n:] if e.get("agent_id") == agent_id]
+        return [e for e in self._tail(n) if e.get("agent_id") == agent_id]
 
     def get_events_by_type(self, event_type: str, n: int = 10) -> List[Dict[str, Any]]:
         """
@@ -109,7 +118,7 @@ class WorldModel:
         Returns:
             List of events matching type, most recent last
         """
-        return [e for e in list(self.events)[-n:] if e.get("type") == event_type]
+        return [e for e in self._tail(n) if e.get("type") == event_type]
 
     def load_from_jsonl(self, path: str) -> int:
         """
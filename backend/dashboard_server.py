@@ -16,15 +16,29 @@ import sys
 from pathlib import Path
 from typing import Dict, Any
 
+# Faster JSON-RPC encoding when orjson is installed. Frames stay text, as the
+# dashboard expects; orjson.JSONDecodeError subclasses json.JSONDecodeError.
+# Non-str keys (e.g. servo ids in motor status) become strings, as with json.
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    _dumps = json.dumps
+    _loads = json.loads
+
 # Add repo to path
-sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from plugins.dashboard_bridge.plugin import DashboardBridgePlugin
-from plugins.motor_control.plugin import MotorControlPlugin
-from plugins.reflex_system.plugin import ReflexSystemPlugin
-from plugins.long_term_memory.plugin import LongTermMemoryPlugin
-from plugins.body_schema.plugin import BodySchemaPlugin
-from plugins.reward_system.plugin import RewardSystemPlugin
+from plugins.system.dashboard_bridge.plugin import DashboardBridgePlugin
+from plugins.actuators.motor_control.plugin import MotorControlPlugin
+from plugins.system.reflex_system.plugin import ReflexSystemPlugin
+from plugins.cognition.long_term_memory.plugin import LongTermMemoryPlugin
+from plugins.cognition.body_schema.plugin import BodySchemaPlugin
+from plugins.cognition.reward_system.plugin import RewardSystemPlugin
 
 logging.basicConfig(
     level=logging.INFO,
@@ -77,11 +91,11 @@ class ANSEDashboardServer:
             async for message in websocket:
                 request = None
                 try:
-                    request = json.loads(message)
+                    request = _loads(message)
                     response = await self._handle_request(request)
-                    await websocket.send(json.dumps(response))
+                    await websocket.send(_dumps(response))
                 except json.JSONDecodeError:
-                    await websocket.send(json.dumps({
+                    await websocket.send(_dumps({
                         "jsonrpc": "2.0",
                         "error": {"code": -32700, "message": "Parse error"},
                         "id": None
@@ -89,7 +103,7 @@ class ANSEDashboardServer:
                 except Exception as e:
                     logger.error(f"Error handling request: {e}", exc_info=True)
                     req_id = request.get("id") if request else None
-                    await websocket.send(json.dumps({
+                    await websocket.send(_dumps({
                         "jsonrpc": "2.0",
                         "error": {"code": -32603, "message": str(e)},
                         "id": req_id
@@ -172,7 +186,7 @@ class ANSEDashboardServer:
                 
                 # Broadcast to all connected clients
                 if self.clients and events:
-                    message = json.dumps({
+                    message = _dumps({
                         "type": "world_model_update",
                         "events": events
                     })
@@ -210,6 +224,7 @@ class ANSEDashboardServer:
                 logger.info("Shutting down...")
             finally:
                 broadcast_task.cancel()
+                self.plugins["dashboard_bridge"].close()
 
 
 async def main():
@@ -7,6 +7,7 @@
  * - reflex_event: Reflex triggered/cleared
  * - actuator_event: Actuator command executed
  * - world_model_update: Complete interpreted state snapshot
+ * - tick: An event and the world_model_update it produced, in one frame
  * - system_event: System-level events (startup, shutdown, etc.)
  */
 
@@ -90,6 +91,13 @@ class ANSEWebSocketManager {
     handleMessage(message) {
         const { type, timestamp, data } = message;
 
+        // A tick frame bundles an event with the world model snapshot it produced
+        if (type === 'tick') {
+            this.handleMessage(message.event);
+            this.handleMessage(message.world);
+            return;
+        }
+
         // Route to specific handler based on type
         switch (type) {
             case 'sensor_event':
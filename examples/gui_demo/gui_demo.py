@@ -15,18 +15,13 @@ import json
 import random
 import sys
 from datetime import datetime
-from pathlib import Path
+from functools import partial
+from itertools import cycle
+from typing import Optional
 
-# Add parent directory to path for ANSE imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-try:
-    from anse.engine_core import EngineCore
-    from anse.world_model import WorldModel
-except ImportError as e:
-    print(f"Error importing ANSE: {e}")
-    print("Make sure you're running this from the ANSE project directory")
-    sys.exit(1)
+# ANSE itself must be installed (pip install -e . from the project root)
+from anse.engine_core import EngineCore, run_event_loop
+from anse.world_model import WorldModel
 
 try:
     import websockets
@@ -34,6 +29,29 @@ except ImportError:
     print("Missing websockets. Install with: pip install websockets")
     sys.exit(1)
 
+try:
+    import orjson
+
+    # Options bound once instead of being passed on every call
+    _orjson_dumps = partial(orjson.dumps, option=orjson.OPT_NAIVE_UTC)
+
+    def _dumps(obj) -> str:
+        # Decoded so websockets still sends text frames the browser can JSON.parse
+        return _orjson_dumps(obj).decode()
+except ImportError:
+    _dumps = json.dumps
+
+# Per-client outbound buffer; a stalled client loses its oldest messages
+# instead of holding up everyone else.
+CLIENT_QUEUE_SIZE = 64
+
+# One approach/retreat cycle of the simulated distance sensor (cm):
+# 50 > 5 cm in 5.5 cm steps (triggers the reflex below 10 cm), then back out to 50 cm
+DISTANCE_CYCLE = (
+    tuple(max(5, 50 - step * 5.5) for step in range(1, 8))
+    + tuple(min(50, 5 + step * 5.5) for step in range(12))
+)
+
 
 class GUIDemoBackend:
     """
@@ -46,10 +64,27 @@ class GUIDemoBackend:
     - All events broadcast to GUI
     """
 
-    def __init__(self, host: str = "0.0.0.0", port: int = 8000):
+    # World model event type -> GUI message type (anything else is a state_update)
+    _EVENT_TYPE_MAP = {
+        "sensor_reading": "sensor_event",
+        "reflex_triggered": "reflex_event",
+        "actuator_action": "actuator_event",
+    }
+
+    def __init__(
+        self,
+        host: str = "0.0.0.0",
+        port: int = 8000,
+        ping_interval: Optional[float] = 60,
+    ):
         self.host = host
         self.port = port
-        self.clients = set()
+        # Keepalive ping period in seconds. Longer means fewer wakeups per client
+        # but slower detection of dead connections; None disables pings and
+        # leaves that to TCP (fine on a LAN).
+        self.ping_interval = ping_interval
+        self.clients = {}  # websocket -> outbound asyncio.Queue
+        self._client_queues = ()  # snapshot of clients.values(), rebuilt on connect/disconnect
         
         # Initialize ANSE engine
         self.engine = None
@@ -57,6 +92,8 @@ class GUIDemoBackend:
         
         # Sensor state (what the sensor measures)
         self.distance = 50  # cm, starts at safe distance
+        self._safe = True   # distance > 10, refreshed once per reading
+        self._clear = True  # distance > 15, refreshed once per reading
         
         # Actuator state (what the actuator does)
         self.movement_state = "IDLE"  # IDLE, MOVING, STOPPED
@@ -64,6 +101,12 @@ class GUIDemoBackend:
         # World model state (brain's understanding)
         self.last_reflex = None  # Track the last reflex triggered
         
+        # Events recorded so far (avoids copying the world model to count them)
+        self._event_count = 0
+        
+        # (key, serialized data) for the last world model snapshot sent
+        self._snapshot_cache = None
+        
     async def initialize_engine(self):
         """Initialize ANSE engine with real plugins."""
         try:
@@ -80,7 +123,10 @@ class GUIDemoBackend:
     
     async def websocket_handler(self, websocket):
         """Handle WebSocket client connections."""
-        self.clients.add(websocket)
+        queue = asyncio.Queue(maxsize=CLIENT_QUEUE_SIZE)
+        self.clients[websocket] = queue
+        self._client_queues = tuple(self.clients.values())
+        sender_task = asyncio.create_task(self._client_sender(websocket, queue))
         client_id = id(websocket)
         print(f"  Client {client_id} connected ({len(self.clients)} total)")
         
@@ -94,108 +140,116 @@ class GUIDemoBackend:
         except websockets.exceptions.ConnectionClosed:
             pass
         finally:
-            self.clients.discard(websocket)
+            sender_task.cancel()
+            self.clients.pop(websocket, None)
+            self._client_queues = tuple(self.clients.values())
             print(f"  >> Client {client_id} disconnected ({len(self.clients)} remain)")
     
-    async def send_current_state(self, websocket=None):
+    async def _client_sender(self, websocket, queue: asyncio.Queue):
+        """Drain one client's outbound queue so a slow client only delays itself."""
+        try:
+            while True:
+                message = await queue.get()
+                await websocket.send(message)
+        except websockets.exceptions.ConnectionClosed:
+            pass  # Connection closed, that's fine
+    
+    @staticmethod
+    def _enqueue(queue: asyncio.Queue, message):
+        """Queue a message for one client, dropping its oldest message if full."""
+        try:
+            queue.put_nowait(message)
+        except asyncio.QueueFull:
+            queue.get_nowait()
+            queue.put_nowait(message)
+    
+    def _broadcast(self, message):
+        """Queue a message for every connected client without awaiting any send."""
+        for queue in self._client_queues:
+            self._enqueue(queue, message)
+    
+    async def send_current_state(self, websocket=None, timestamp: Optional[str] = None):
         """Send current state snapshot to one client or all clients."""
         state = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp or datetime.now().isoformat(),
             "sensors": {
                 "distance": round(self.distance, 1),
-                "safe": self.distance > 10
+                "safe": self._safe
             },
             "actuators": {
                 "movement": self.movement_state
             },
             "reflexes": []
         }
-        message = json.dumps({"type": "state_update", "data": state})
+        message = _dumps({"type": "state_update", "data": state})
         
-        target_clients = [websocket] if websocket else self.clients
-        for client in target_clients:
-            try:
-                if client:
-                    await client.send(message)
-            except Exception:
-                pass  # Connection closed, that's fine
+        if websocket is None:
+            self._broadcast(message)
+        elif websocket in self.clients:
+            self._enqueue(self.clients[websocket], message)
     
-    async def broadcast_world_model_event(self, event_dict: dict):
-        """Broadcast a world model event to all connected clients in GUI format."""
-        event_type = event_dict.get("type", "unknown")
+    def _event_message(self, event_dict: dict) -> str:
+        """Serialize a world model event in GUI format."""
+        return _dumps({
+            "type": self._EVENT_TYPE_MAP.get(event_dict.get("type"), "state_update"),
+            "timestamp": event_dict.get("timestamp"),
+            "data": event_dict
+        })
+    
+    def _snapshot_message(self, timestamp: str) -> str:
+        """Serialize the current world model state (brain snapshot)."""
+        distance = round(self.distance, 1)
+        key = (distance, self.movement_state, self.last_reflex)
         
-        # Convert to GUI message format
-        if event_type == "sensor_reading":
-            message = json.dumps({
-                "type": "sensor_event",
-                "timestamp": event_dict.get("timestamp"),
-                "data": event_dict
-            })
-        elif event_type == "reflex_triggered":
-            message = json.dumps({
-                "type": "reflex_event",
-                "timestamp": event_dict.get("timestamp"),
-                "data": event_dict
-            })
-        elif event_type == "actuator_action":
-            message = json.dumps({
-                "type": "actuator_event",
-                "timestamp": event_dict.get("timestamp"),
-                "data": event_dict
-            })
+        # Only the state fields are reusable; the timestamp and event count
+        # change on every call and are spliced in afterwards
+        if self._snapshot_cache is not None and self._snapshot_cache[0] == key:
+            data_json = self._snapshot_cache[1]
         else:
-            message = json.dumps({
-                "type": "state_update",
-                "timestamp": event_dict.get("timestamp"),
-                "data": event_dict
+            data_json = _dumps({
+                "distance_cm": distance,
+                "safe": self._safe,
+                "actuator_state": self.movement_state,
+                "last_reflex": self.last_reflex or "none"
             })
+            self._snapshot_cache = (key, data_json)
         
-        if self.clients:
-            await asyncio.gather(
-                *[client.send(message) for client in self.clients if client],
-                return_exceptions=True
-            )
+        return (
+            '{"type": "world_model_update", "timestamp": %s, '
+            '"data": %s, "total_events": %d}}'
+        ) % (_dumps(timestamp), data_json[:-1], self._event_count)
     
-    async def broadcast_world_model_snapshot(self):
-        """Broadcast the current world model state (brain snapshot) to all clients."""
-        world_model_data = {
-            "distance_cm": round(self.distance, 1),
-            "safe": self.distance > 10,
-            "actuator_state": self.movement_state,
-            "last_reflex": self.last_reflex or "none",
-            "total_events": len(self.world_model.get_recent(100)) if self.world_model else 0
-        }
+    async def record_and_broadcast_event(
+        self,
+        event_type: str,
+        event_data: dict,
+        timestamp: Optional[str] = None
+    ):
+        """Record event to world model AND broadcast to GUI.
         
-        snapshot = {
-            "type": "world_model_update",
-            "timestamp": datetime.now().isoformat(),
-            "data": world_model_data
-        }
+        Events from the same sensor tick share its timestamp, so it is
+        formatted once by the caller and passed down.
+        """
+        if timestamp is None:
+            timestamp = datetime.now().isoformat()
         
-        message = json.dumps(snapshot)
-        if self.clients:
-            await asyncio.gather(
-                *[client.send(message) for client in self.clients if client],
-                return_exceptions=True
-            )
-    
-    async def record_and_broadcast_event(self, event_type: str, event_data: dict):
-        """Record event to world model AND broadcast to GUI."""
         # Record to ANSE world model
         event = {
             "type": event_type,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
             **event_data
         }
         
         if self.world_model:
             self.world_model.append_event(event)
+            self._event_count += 1
         
-        # Broadcast to GUI
-        await self.broadcast_world_model_event(event)
-        
-        # Broadcast world model snapshot (brain state)
-        await self.broadcast_world_model_snapshot()
+        # Broadcast the event and the resulting world model snapshot (brain
+        # state) to the GUI as a single frame
+        self._broadcast('{"type": "tick", "event": %s, "world": %s}' % (
+            self._event_message(event),
+            self._snapshot_message(timestamp)
+        ))
     
     async def simulate_distance_sensor(self):
         """
@@ -207,43 +261,32 @@ class GUIDemoBackend:
         print("[SENSOR] Starting distance sensor simulation...")
         print("[SENSOR] Distance: 50cm (safe) > approaching > 5cm (dangerous) > receding > 50cm (safe)\n")
         
-        iteration = 0
-        while True:
-            iteration += 1
+        for distance in cycle(DISTANCE_CYCLE):
+            self.distance = distance
+            self._safe = distance > 10
+            self._clear = distance > 15
             
-            # Simulate distance varying (object approaching)
-            # Eventually triggers the reflex (distance < 10cm = too close)
-            if iteration < 8:
-                # Gradually approach: 50 > 5 cm
-                self.distance = max(5, 50 - (iteration * 5.5))
-            else:
-                # Then move away: 5 > 50 cm
-                self.distance = min(50, 5 + ((iteration - 8) * 5.5))
-                if iteration > 18:
-                    iteration = 0  # Reset cycle
+            # One timestamp for every event produced by this reading
+            now = datetime.now().isoformat()
             
             # Record sensor reading to world model
             await self.record_and_broadcast_event("sensor_reading", {
                 "sensor_id": "distance_sensor_01",
                 "reading_type": "proximity",
                 "distance_cm": round(self.distance, 1),
-                "safe": self.distance > 10
-            })
+                "safe": self._safe
+            }, timestamp=now)
             
             # Check rules (RULE VALIDATION phase)
-            await self.check_and_trigger_reflexes()
-            
-            # Send updated state snapshot
-            await self.send_current_state()
+            await self.check_and_trigger_reflexes(timestamp=now)
             
             # Show progress every 5 events
-            if self.world_model and len(self.world_model.get_recent(100)) % 5 == 0:
-                event_count = len(self.world_model.get_recent(100))
-                print(f"[DEMO] {event_count} events recorded, distance={self.distance:.1f}cm, state={self.movement_state}")
+            if self.world_model and self._event_count % 5 == 0:
+                print(f"[DEMO] {self._event_count} events recorded, distance={self.distance:.1f}cm, state={self.movement_state}")
             
             await asyncio.sleep(1.5)  # Sensor reads every 1.5 seconds
     
-    async def check_and_trigger_reflexes(self):
+    async def check_and_trigger_reflexes(self, timestamp: Optional[str] = None):
         """
         Check sensor conditions and trigger reflexes.
         
@@ -261,28 +304,28 @@ class GUIDemoBackend:
                 "reflex": "Proximity Alert",
                 "condition": "distance < 10cm",
                 "action": "STOP"
-            })
+            }, timestamp=timestamp)
             
             # Execute actuator action
-            await self.execute_actuator_action("STOP")
+            await self.execute_actuator_action("STOP", timestamp=timestamp)
         
-        elif self.distance > 15 and self.movement_state == "STOPPED":
+        elif self._clear and self.movement_state == "STOPPED":
             # Safe zone again, can move
             self.last_reflex = "clear_to_move"
             await self.record_and_broadcast_event("reflex_triggered", {
                 "reflex": "Clear to Move",
                 "condition": "distance > 15cm",
                 "action": "RESUME"
-            })
+            }, timestamp=timestamp)
             
             # Execute actuator action
-            await self.execute_actuator_action("MOVING")
+            await self.execute_actuator_action("MOVING", timestamp=timestamp)
         else:
             # No reflex triggered
             if self.last_reflex is not None:
                 self.last_reflex = None
     
-    async def execute_actuator_action(self, action: str):
+    async def execute_actuator_action(self, action: str, timestamp: Optional[str] = None):
         """
         Execute an actuator action.
         
@@ -304,7 +347,7 @@ class GUIDemoBackend:
             "action": action,
             "old_state": old_state,
             "new_state": self.movement_state
-        })
+        }, timestamp=timestamp)
     
     async def run(self):
         """Start the GUI demo backend."""
@@ -325,7 +368,7 @@ class GUIDemoBackend:
             self.websocket_handler,
             self.host,
             self.port,
-            ping_interval=20,
+            ping_interval=self.ping_interval,
             ping_timeout=20
         ):
             print(f"[OK] WebSocket server running on ws://{self.host}:{self.port}")
@@ -347,6 +390,6 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        run_event_loop(main())
     except KeyboardInterrupt:
         print("\n\nDemo stopped")
@@ -5,45 +5,63 @@ Serves HTML from the same directory and WebSocket from the backend.
 """
 
 import asyncio
+import hashlib
 import json
 from pathlib import Path
-from http.server import SimpleHTTPRequestHandler
-import socketserver
-import threading
 import webbrowser
 import time
 
 import sys
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+from anse.engine_core import run_event_loop
 from gui_demo import GUIDemoBackend
 
+try:
+    from aiohttp import web
+except ImportError:
+    print("Missing aiohttp. Install with: pip install aiohttp")
+    sys.exit(1)
 
-def start_http_server(port=8001):
-    """Start a simple HTTP server on a different port."""
-    handler = SimpleHTTPRequestHandler
+DEMO_DIR = Path(__file__).parent
+
+
+def build_http_app() -> web.Application:
+    """Build the HTTP app: the dashboard page from memory, anything else from disk."""
+    index_html = (DEMO_DIR / "index.html").read_bytes()
+    # The page never changes while the server runs, so its ETag is fixed too
+    etag = '"%s"' % hashlib.blake2b(index_html, digest_size=16).hexdigest()
+    preloaded = {"/": index_html, "/index.html": index_html}
     
-    class MyHTTPHandler(handler):
-        def __init__(self, *args, **kwargs):
-            super().__init__(*args, directory=Path(__file__).parent, **kwargs)
-        
-        def log_message(self, format, *args):
-            # Suppress HTTP logging
-            pass
+    @web.middleware
+    async def serve_preloaded(request, handler):
+        body = preloaded.get(request.path)
+        if body is not None:
+            # Reloads and reconnect polling get an empty 304 instead of the page
+            if request.headers.get("If-None-Match") == etag:
+                return web.Response(status=304, headers={"ETag": etag})
+            return web.Response(body=body, content_type="text/html", headers={"ETag": etag})
+        return await handler(request)
     
-    httpd = socketserver.TCPServer(("0.0.0.0", port), MyHTTPHandler)
-    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
-    thread.start()
+    app = web.Application(middlewares=[serve_preloaded])
+    app.router.add_static("/", DEMO_DIR)
+    return app
+
+
+async def start_http_server(port=8001):
+    """Start the HTTP server on a different port, on the running event loop."""
+    runner = web.AppRunner(build_http_app(), access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, "0.0.0.0", port).start()
     
     print(f"✓ HTTP server running on http://localhost:{port}")
-    return httpd
+    return runner
 
 
 async def main():
     """Start both HTTP and WebSocket servers."""
     
     # Start HTTP server
-    http_server = start_http_server(port=8001)
+    http_server = await start_http_server(port=8001)
     
     # Wait a moment then open browser
     await asyncio.sleep(1)
@@ -51,7 +69,10 @@ async def main():
     
     # Start WebSocket server
     backend = GUIDemoBackend(host="0.0.0.0", port=8000)
-    await backend.run()
+    try:
+        await backend.run()
+    finally:
+        await http_server.cleanup()
 
 
 if __name__ == "__main__":
@@ -60,6 +81,6 @@ if __name__ == "__main__":
         print("ANSE GUI Demo Server")
         print("="*60 + "\n")
         
-        asyncio.run(main())
+        run_event_loop(main())
     except KeyboardInterrupt:
         print("\n\nShutdown complete")
@@ -11,6 +11,9 @@ Usage:
     python start_with_ui.py
     python start_with_ui.py --engine-port 8765 --ui-port 5000
     python start_with_ui.py --ui-host 0.0.0.0 --ui-port 5000 --debug
+
+With asgiref and hypercorn installed, the operator-ui runs in the engine's
+event loop; otherwise (or with --debug) it runs in a separate process.
 """
 
 import asyncio
@@ -23,9 +26,14 @@ from pathlib import Path
 # Add anse to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from anse.engine_core import EngineCore
+from anse.engine_core import EngineCore, run_event_loop
 from anse.audit import AuditLogger
-from anse.operator_ui_bridge import serve_operator_ui, get_operator_ui_bridge
+from anse.operator_ui_bridge import (
+    ASGI_SERVER_AVAILABLE,
+    get_operator_ui_bridge,
+    serve_operator_ui,
+    serve_operator_ui_async,
+)
 
 
 async def run_engine(host: str, port: int, audit_file: str) -> None:
@@ -34,6 +42,16 @@ async def run_engine(host: str, port: int, audit_file: str) -> None:
     await engine.bridge.serve(host, port)
 
 
+async def run_engine_and_ui(
+    host: str, port: int, audit_file: str, ui_host: str, ui_port: int
+) -> None:
+    """Run ANSE engine and operator-ui together on one event loop."""
+    await asyncio.gather(
+        run_engine(host, port, audit_file),
+        serve_operator_ui_async(host=ui_host, port=ui_port),
+    )
+
+
 def run_ui(host: str, port: int, debug: bool) -> None:
     """Run operator-ui server."""
     try:
@@ -101,6 +119,19 @@ def main():
     Control+C to stop all services.
     """)
 
+    # Host operator-ui in this process when an ASGI server is installed;
+    # debug mode needs Flask's own reloader, so it keeps the separate process
+    if ASGI_SERVER_AVAILABLE and not args.debug:
+        try:
+            run_event_loop(run_engine_and_ui(
+                args.engine_host, args.engine_port, args.audit_file,
+                args.ui_host, args.ui_port
+            ))
+        except KeyboardInterrupt:
+            print("\nShutting down...")
+            sys.exit(0)
+        return
+
     # Start operator-ui in a separate process
     ui_process = Process(
         target=run_ui,
@@ -111,7 +142,7 @@ def main():
 
     try:
         # Run engine in main process
-        asyncio.run(run_engine(args.engine_host, args.engine_port, args.audit_file))
+        run_event_loop(run_engine(args.engine_host, args.engine_port, args.audit_file))
     except KeyboardInterrupt:
         print("\nShutting down...")
         ui_process.terminate()
@@ -13,6 +13,11 @@ from typing import Dict, Any, Optional
 logger = logging.getLogger(__name__)
 
 
+def _clamp(value: float, low: float, high: float) -> float:
+    """Limit value to [low, high] with plain comparisons (no min/max calls); NaN maps to high."""
+    return low if value < low else value if value <= high else high
+
+
 class MotorControlPlugin:
     """Robot motor and servo controller."""
 
@@ -38,8 +43,8 @@ class MotorControlPlugin:
             Status dict with current speeds
         """
         # Clamp speeds to valid range
-        left_speed = max(-100, min(100, float(left_speed)))
-        right_speed = max(-100, min(100, float(right_speed)))
+        left_speed = _clamp(float(left_speed), -100.0, 100.0)
+        right_speed = _clamp(float(right_speed), -100.0, 100.0)
 
         self.wheel_speeds["left"] = left_speed
         self.wheel_speeds["right"] = right_speed
@@ -71,7 +76,7 @@ class MotorControlPlugin:
             Status dict with servo position
         """
         servo_id = int(servo_id)
-        angle = max(0, min(180, float(angle)))
+        angle = _clamp(float(angle), 0.0, 180.0)
         speed = float(speed) if speed is not None else 50
 
         self.servo_positions[servo_id] = angle
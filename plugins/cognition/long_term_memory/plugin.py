@@ -5,13 +5,21 @@ Provides persistent knowledge storage and retrieval beyond the world model's eve
 Simple text-based implementation with semantic search via substring matching.
 """
 
+import heapq
 import logging
-import uuid
+import re
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Set
 
 logger = logging.getLogger(__name__)
 
+# Word tokens used for the recall index (text is lowercased before tokenizing)
+_TOKEN_RE = re.compile(r"\w+")
+
+# Number of distinct (query, category) match lists recall() keeps
+RECALL_CACHE_SIZE = 128
+
 
 class LongTermMemoryPlugin:
     """Persistent agent memory with semantic search."""
@@ -23,6 +31,19 @@ class LongTermMemoryPlugin:
     def __init__(self):
         """Initialize memory store."""
         self.memories: Dict[str, Dict[str, Any]] = {}
+        # Inverted index: lowercase word token -> ids of memories containing it
+        self._index: Dict[str, Set[str]] = {}
+        # Lowercased text of each memory, computed once at remember() time
+        self._text_lower: Dict[str, str] = {}
+        # Insertion position of each memory, so indexed recall keeps store order
+        self._order: Dict[str, int] = {}
+        # Category -> that category's memories (id -> entry), in store order
+        self._by_category: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        # Source of memory ids; never reset, so ids stay unique for the plugin's lifetime
+        self._next_id = 0
+        # (lowercase query, category) -> matching memories, least recently used first;
+        # cleared whenever memories are added or removed
+        self._recall_cache = OrderedDict()
 
     async def remember(self, text: str, category: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -35,15 +56,24 @@ class LongTermMemoryPlugin:
         Returns:
             Memory entry with ID
         """
-        memory_id = str(uuid.uuid4())[:8]
+        self._next_id += 1
+        memory_id = format(self._next_id, "x")
 
-        self.memories[memory_id] = {
+        memory = {
             "id": memory_id,
             "text": text,
             "category": category or "general",
             "created_at": datetime.now().isoformat(),
             "accessed_count": 0
         }
+        self.memories[memory_id] = memory
+        self._by_category.setdefault(memory["category"], {})[memory_id] = memory
+        text_lower = text.lower()
+        self._text_lower[memory_id] = text_lower
+        self._recall_cache.clear()
+        self._order[memory_id] = self._next_id
+        for token in set(_TOKEN_RE.findall(text_lower)):
+            self._index.setdefault(token, set()).add(memory_id)
 
         logger.info(f"[MEMORY] Remembered [{category or 'general'}] {memory_id}: {text[:50]}")
 
@@ -70,28 +100,91 @@ class LongTermMemoryPlugin:
         Returns:
             Dict with status and matching memory entries
         """
-        results = []
+        q = query.lower()
+        key = (q, category or None)
+
+        # Which memories match depends only on stored text and categories,
+        # so repeated queries reuse the match list until memory changes
+        matches = self._recall_cache.get(key)
+        if matches is None:
+            matches = self._match(q, category)
+            self._recall_cache[key] = matches
+            if len(self._recall_cache) > RECALL_CACHE_SIZE:
+                self._recall_cache.popitem(last=False)
+        else:
+            self._recall_cache.move_to_end(key)
 
-        for memory_id, memory in self.memories.items():
-            # Filter by category if specified
-            if category and memory["category"] != category:
-                continue
+        for memory in matches:
+            memory["accessed_count"] += 1
 
-            # Simple substring match (can be upgraded to semantic similarity)
-            if query.lower() in memory["text"].lower():
-                memory["accessed_count"] += 1
-                results.append(memory.copy())
-
-        # Sort by relevance (accessed count) and return top N
-        results.sort(key=lambda m: m["accessed_count"], reverse=True)
-        logger.info(f"[MEMORY] Recalled {len(results[:limit])} memories for query: {query}")
+        # Top N by relevance (accessed count); only those entries are copied
+        top = heapq.nlargest(limit, matches, key=lambda m: m["accessed_count"])
+        results = [memory.copy() for memory in top]
+        logger.info(f"[MEMORY] Recalled {len(results)} memories for query: {query}")
 
         return {
             "status": "success",
-            "results": results[:limit],
-            "count": len(results[:limit])
+            "results": results,
+            "count": len(results)
         }
 
+    def _match(self, q: str, category: Optional[str]) -> List[Dict[str, Any]]:
+        """
+        Find the memories whose text contains a lowercase query, in store order.
+
+        Args:
+            q: Lowercase query string
+            category: Optional category filter
+
+        Returns:
+            Matching memory entries (the stored dicts, not copies)
+        """
+        # Filter by category if specified
+        pool = self._by_category.get(category, {}) if category else self.memories
+        candidates = self._candidates(q)
+        if candidates is None:
+            memories = pool.values()
+        else:
+            in_pool = [memory_id for memory_id in candidates if memory_id in pool]
+            memories = [pool[memory_id] for memory_id in sorted(in_pool, key=self._order.__getitem__)]
+
+        matches = []
+        for memory in memories:
+            # Simple substring match (can be upgraded to semantic similarity)
+            if q in self._text_lower[memory["id"]]:
+                matches.append(memory)
+        return matches
+
+    def _candidates(self, q: str) -> Optional[Set[str]]:
+        """
+        Narrow a lowercase substring query to the memories that could contain it.
+
+        Every word in the query must appear inside some word of a matching
+        memory, so each query word is resolved against the index vocabulary
+        and the resulting id sets are intersected. Callers still verify the
+        full substring match.
+
+        Args:
+            q: Lowercase query string
+
+        Returns:
+            Candidate memory ids, or None if the query has no words to look up
+        """
+        terms = set(_TOKEN_RE.findall(q))
+        if not terms:
+            return None
+
+        candidates: Optional[Set[str]] = None
+        for term in terms:
+            ids: Set[str] = set()
+            for token, posting in self._index.items():
+                if term in token:
+                    ids |= posting
+            candidates = ids if candidates is None else candidates & ids
+            if not candidates:
+                break
+        return candidates
+
     async def forget(self, memory_id: str) -> Dict[str, Any]:
         """
         Delete a specific memory.
@@ -103,8 +196,20 @@ class LongTermMemoryPlugin:
             Confirmation dict
         """
         if memory_id in self.memories:
-            memory_text = self.memories[memory_id]["text"]
-            del self.memories[memory_id]
+            memory = self.memories.pop(memory_id)
+            memory_text = memory["text"]
+            in_category = self._by_category[memory["category"]]
+            del in_category[memory_id]
+            if not in_category:
+                del self._by_category[memory["category"]]
+            del self._order[memory_id]
+            self._recall_cache.clear()
+            for token in set(_TOKEN_RE.findall(self._text_lower.pop(memory_id))):
+                posting = self._index.get(token)
+                if posting is not None:
+                    posting.discard(memory_id)
+                    if not posting:
+                        del self._index[token]
             logger.info(f"[MEMORY] Forgot {memory_id}: {memory_text[:30]}")
             return {"status": "success", "message": f"Memory {memory_id} deleted"}
         else:
@@ -120,10 +225,10 @@ class LongTermMemoryPlugin:
         Returns:
             Dict with status and list of memory entries
         """
-        results = list(self.memories.values())
-
         if category:
-            results = [m for m in results if m["category"] == category]
+            results = list(self._by_category.get(category, {}).values())
+        else:
+            results = list(self.memories.values())
 
         logger.info(f"[MEMORY] Listed {len(results)} memories" + (f" (category: {category})" if category else ""))
 
@@ -142,6 +247,11 @@ class LongTermMemoryPlugin:
         """
         count = len(self.memories)
         self.memories.clear()
+        self._index.clear()
+        self._text_lower.clear()
+        self._order.clear()
+        self._by_category.clear()
+        self._recall_cache.clear()
         logger.warning(f"[MEMORY] CLEARED ALL {count} MEMORIES")
 
         return {
@@ -6,7 +6,9 @@ Agents can receive rewards/penalties and accumulate them over time.
 """
 
 import logging
-from typing import Dict, Any, List, Optional
+from collections import deque
+from itertools import islice
+from typing import Deque, Dict, Any, List, Optional
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -23,7 +25,8 @@ class RewardSystemPlugin:
         """Initialize reward system."""
         self.total_reward: float = 0.0
         self.reward_count: int = 0
-        self.reward_history: List[Dict[str, Any]] = []
+        # Last 100 events; the deque drops the oldest itself
+        self.reward_history: Deque[Dict[str, Any]] = deque(maxlen=100)
         self.reward_threshold: float = 0.0
 
     async def reward(
@@ -54,10 +57,6 @@ class RewardSystemPlugin:
         }
         self.reward_history.append(event)
 
-        # Keep only last 100 events
-        if len(self.reward_history) > 100:
-            self.reward_history.pop(0)
-
         logger.info(f"[REWARD] +{value} ({reason or 'unspecified'}) -> Total: {self.total_reward}")
 
         threshold_met = self.is_goal_achieved()
@@ -118,7 +117,7 @@ class RewardSystemPlugin:
             Dict with reward history array
         """
         limit = max(1, min(limit, 100))  # Clamp to 1-100
-        recent = self.reward_history[-limit:]
+        recent = self.recent_events(limit)
 
         return {
             "status": "success",
@@ -150,6 +149,19 @@ class RewardSystemPlugin:
             "goal_achieved": self.is_goal_achieved()
         }
 
+    def recent_events(self, limit: int) -> List[Dict[str, Any]]:
+        """
+        Get the most recent reward events, oldest first.
+
+        Args:
+            limit: Maximum number of events to return
+
+        Returns:
+            List of reward events
+        """
+        start = max(len(self.reward_history) - limit, 0)
+        return list(islice(self.reward_history, start, None))
+
     def is_goal_achieved(self) -> bool:
         """
         Check if reward threshold has been met.
@@ -23,11 +23,15 @@ IMPORTANT: ANSE is EVENT-DRIVEN, not polling-based
   - Assume tools will be called periodically
 """
 
+import asyncio
+import logging
 import random
 import time
 from typing import Dict, Any, Optional
 from anse.plugin import SensorPlugin
 
+logger = logging.getLogger(__name__)
+
 
 class ExampleTemperatureSensor(SensorPlugin):
     """Example temperature sensor plugin.
@@ -77,7 +81,7 @@ class ExampleTemperatureSensor(SensorPlugin):
         self.min_temp = 15
         self.max_temp = 35
         
-        print(f"[{self.name}] Initialized")
+        logger.info("[%s] Initialized", self.name)
     
     async def on_load(self) -> None:
         """Called when ANSE loads this plugin.
@@ -88,7 +92,7 @@ class ExampleTemperatureSensor(SensorPlugin):
         - Initializing connections
         """
         self.connected = True
-        print(f"[{self.name}] Loaded and connected")
+        logger.info("[%s] Loaded and connected", self.name)
     
     async def on_unload(self) -> None:
         """Called when ANSE unloads this plugin.
@@ -99,7 +103,7 @@ class ExampleTemperatureSensor(SensorPlugin):
         - Stop threads
         """
         self.connected = False
-        print(f"[{self.name}] Unloaded")
+        logger.info("[%s] Unloaded", self.name)
     
     async def validate_connection(self) -> bool:
         """Validate that the sensor is connected and working."""
@@ -159,9 +163,13 @@ class ExampleTemperatureSensor(SensorPlugin):
     
     async def get_sensor_data(self) -> Dict[str, Any]:
         """Get all sensor readings at once."""
-        temp = await self.get_temperature()
-        humidity = await self.get_humidity()
-        status = await self.get_status()
+        # Independent reads: run them together, so real hardware waits for
+        # the slowest one instead of all three in turn
+        temp, humidity, status = await asyncio.gather(
+            self.get_temperature(),
+            self.get_humidity(),
+            self.get_status()
+        )
         
         return {
             "temperature": temp["temperature"],
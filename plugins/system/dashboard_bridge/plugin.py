@@ -5,13 +5,43 @@ Safe, read-focused bridge between ANSE and the local web dashboard.
 Provides whitelisted access to plugin state and safe control operations.
 """
 
+import asyncio
 import logging
 import base64
+import hashlib
+import threading
+import time
+from itertools import islice
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# SIMD base64 for camera frames when pybase64 is installed
+try:
+    from pybase64 import b64encode_as_string as _b64encode_str
+except ImportError:
+    def _b64encode_str(data: bytes) -> str:
+        return base64.b64encode(data).decode('ascii')
+
+# libjpeg-turbo JPEG encoding for camera frames when simplejpeg is installed
+try:
+    import simplejpeg
+    SIMPLEJPEG_AVAILABLE = True
+except ImportError:
+    SIMPLEJPEG_AVAILABLE = False
+
+# JPEG quality for dashboard camera frames
+JPEG_QUALITY = 80
+
+# Seconds get_detected_devices() reuses its last scan before probing hardware again
+DEVICE_CACHE_TTL = 30.0
+
+
+def _copy_devices(devices: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a device scan so callers cannot alter the cached one."""
+    return {kind: [dict(device) for device in found] for kind, found in devices.items()}
+
 
 class DashboardBridgePlugin:
     """Safe bridge for web dashboard to query and control ANSE."""
@@ -25,7 +55,24 @@ class DashboardBridgePlugin:
         self.plugins_ref = {}  # Will be populated by engine
         self.engine = None  # Will be populated by engine
         self.world_model = None  # Will be populated by engine
+        # ((frame content digest, raw), base64 image) of the last encoded frame
         self._last_frame_cache = None
+        # Open cv2.VideoCapture per camera id, kept between get_camera_frame() calls
+        self._captures: Dict[int, Any] = {}
+        self._camera_lock = threading.Lock()
+        # Last get_detected_devices() result and its time.monotonic() stamp
+        self._devices_cache: Optional[Dict[str, Any]] = None
+        self._devices_cache_time = 0.0
+        # Plugins this bridge reads, resolved once in set_plugins_reference()
+        self._motor_plugin = None
+        self._reflex_plugin = None
+        self._memory_plugin = None
+        self._reward_plugin = None
+        self._body_plugin = None
+        self._plugin_status: List[Dict[str, Any]] = []
+        # get_reflex_status() result and the reflex plugin revision it was built from
+        self._reflex_status: List[Dict[str, Any]] = []
+        self._reflex_status_revision: Optional[int] = None
 
     def set_engine_reference(self, engine: Any) -> None:
         """Allow engine to register itself."""
@@ -34,11 +81,37 @@ class DashboardBridgePlugin:
             self.world_model = engine.world_model
 
     def set_plugins_reference(self, plugins_dict: Dict[str, Any]) -> None:
-        """Allow engine to register available plugins."""
+        """
+        Allow engine to register available plugins.
+
+        Plugin references and status are captured here, so call it again
+        if plugins are added or removed later.
+        """
         self.plugins_ref = plugins_dict
+        self._motor_plugin = plugins_dict.get("motor_control")
+        self._reflex_plugin = plugins_dict.get("reflex_system")
+        self._memory_plugin = plugins_dict.get("long_term_memory")
+        self._reward_plugin = plugins_dict.get("reward_system")
+        self._body_plugin = plugins_dict.get("body_schema")
+        self._reflex_status_revision = None
+        self._plugin_status = [
+            {
+                "name": name,
+                "class": plugin.__class__.__name__,
+                "version": getattr(plugin, "version", "unknown")
+            }
+            for name, plugin in plugins_dict.items()
+            if name != "dashboard_bridge"
+        ]
 
     async def get_detected_devices(self) -> Dict[str, Any]:
         """Detect all connected devices (cameras, microphones, etc.)."""
+        # Probing opens every camera index and queries audio devices, which takes
+        # seconds on some systems; dashboard polls within the TTL reuse the last scan
+        now = time.monotonic()
+        if self._devices_cache is not None and now - self._devices_cache_time < DEVICE_CACHE_TTL:
+            return _copy_devices(self._devices_cache)
+        
         devices = {
             "cameras": [],
             "microphones": [],
@@ -48,8 +121,20 @@ class DashboardBridgePlugin:
         try:
             # Detect cameras
             import cv2
+            # Captures the frame worker holds open, read under its lock
+            held = await asyncio.get_running_loop().run_in_executor(None, self._held_resolutions)
             for i in range(10):
                 try:
+                    if i in held:
+                        # Already streaming to the dashboard; reopening could fail
+                        w, h = held[i]
+                        devices["cameras"].append({
+                            "id": i,
+                            "name": f"Camera {i}",
+                            "resolution": f"{w}x{h}",
+                            "available": True
+                        })
+                        continue
                     cap = cv2.VideoCapture(i)
                     if cap.isOpened():
                         ret, frame = cap.read()
@@ -97,48 +182,119 @@ class DashboardBridgePlugin:
             logger.warning(f"[DASHBOARD_BRIDGE] Microphone detection failed: {e}")
         
         logger.info(f"[DASHBOARD_BRIDGE] Detected devices: {len(devices['cameras'])} cameras, {len(devices['microphones'])} microphones")
-        return devices
+        self._devices_cache = devices
+        self._devices_cache_time = now
+        return _copy_devices(devices)
 
-    async def get_camera_frame(self, camera_id: int = 0) -> str:
-        """Get the current camera frame as base64 JPEG."""
-        try:
-            import cv2
+    def _held_resolutions(self) -> Dict[int, Any]:
+        """Return (width, height) of each camera get_camera_frame() holds open."""
+        import cv2
+
+        with self._camera_lock:
+            return {
+                camera_id: (
+                    int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                    int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+                )
+                for camera_id, cap in self._captures.items()
+            }
+
+    async def get_camera_frame(self, camera_id: int = 0, raw: bool = False) -> str:
+        """
+        Get the current camera frame as base64 JPEG.
+
+        Args:
+            camera_id: Camera device index
+            raw: Return an uncompressed binary PPM (RGB) instead of JPEG, skipping
+                the encode for local clients that draw the pixels themselves
+
+        Returns:
+            Base64-encoded image, or "" if no frame is available
+        """
+        # Grabbing, hashing and encoding block for tens of ms; run them in a worker
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self._capture_frame, camera_id, raw
+        )
+
+    def _capture_frame(self, camera_id: int, raw: bool) -> str:
+        """Blocking implementation of get_camera_frame()."""
+        # One worker at a time touches the captures and the frame cache
+        with self._camera_lock:
+            try:
+                import cv2
             
-            cap = cv2.VideoCapture(camera_id)
-            if not cap.isOpened():
-                logger.warning(f"[DASHBOARD_BRIDGE] Camera {camera_id} not available")
-                return ""
+                cap = self._captures.get(camera_id)
+                if cap is None:
+                    cap = cv2.VideoCapture(camera_id)
+                    if not cap.isOpened():
+                        cap.release()
+                        logger.warning(f"[DASHBOARD_BRIDGE] Camera {camera_id} not available")
+                        return ""
+                    # Keep the driver queue short so a grab() returns a recent frame
+                    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+                    self._captures[camera_id] = cap
             
-            ret, frame = cap.read()
-            cap.release()
+                # grab() only advances the stream; retrieve() decodes the one frame we send
+                ret, frame = cap.retrieve() if cap.grab() else (False, None)
             
-            if not ret or frame is None:
-                logger.warning(f"[DASHBOARD_BRIDGE] Failed to capture frame from camera {camera_id}")
-                return ""
+                if not ret or frame is None:
+                    # Drop the capture so the next call reopens the device
+                    self._captures.pop(camera_id).release()
+                    logger.warning(f"[DASHBOARD_BRIDGE] Failed to capture frame from camera {camera_id}")
+                    return ""
             
-            # Encode frame as JPEG
-            success, buffer = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, 80])
+                # Unchanged pixels (static scene, polling faster than the camera)
+                # reuse the previous encoding instead of running JPEG + base64 again
+                key = (hashlib.blake2b(frame, digest_size=16).digest(), raw)
+                if self._last_frame_cache is not None and self._last_frame_cache[0] == key:
+                    return self._last_frame_cache[1]
             
-            if not success:
-                logger.warning(f"[DASHBOARD_BRIDGE] Failed to encode frame as JPEG")
-                return ""
+                if raw:
+                    height, width = frame.shape[:2]
+                    if frame.ndim == 3:
+                        # BGR -> RGB through a reversed channel view; tobytes() does the copy
+                        frame_bytes = b"P6\n%d %d\n255\n" % (width, height) + frame[..., ::-1].tobytes()
+                    else:
+                        frame_bytes = b"P5\n%d %d\n255\n" % (width, height) + frame.tobytes()
+                # Encode frame as JPEG
+                elif SIMPLEJPEG_AVAILABLE and frame.ndim == 3 and frame.shape[2] == 3:
+                    frame_bytes = simplejpeg.encode_jpeg(frame, quality=JPEG_QUALITY, colorspace='BGR')
+                else:
+                    # Optimized Huffman tables: smaller frames to base64 and send, same quality
+                    params = [
+                        int(cv2.IMWRITE_JPEG_QUALITY), JPEG_QUALITY,
+                        int(cv2.IMWRITE_JPEG_OPTIMIZE), 1
+                    ]
+                    success, buffer = cv2.imencode('.jpg', frame, params)
+                
+                    if not success:
+                        logger.warning(f"[DASHBOARD_BRIDGE] Failed to encode frame as JPEG")
+                        return ""
+                
+                    frame_bytes = buffer.tobytes()
             
-            # Convert to base64
-            frame_bytes = buffer.tobytes()
-            frame_b64 = base64.b64encode(frame_bytes).decode('utf-8')
+                # Convert to base64
+                frame_b64 = _b64encode_str(frame_bytes)
             
-            # Cache the frame
-            self._last_frame_cache = frame_b64
+                # Cache the frame
+                self._last_frame_cache = (key, frame_b64)
             
-            logger.debug(f"[DASHBOARD_BRIDGE] Captured frame from camera {camera_id}")
-            return frame_b64
+                logger.debug(f"[DASHBOARD_BRIDGE] Captured frame from camera {camera_id}")
+                return frame_b64
             
-        except ImportError:
-            logger.error(f"[DASHBOARD_BRIDGE] OpenCV not installed")
-            return ""
-        except Exception as e:
-            logger.error(f"[DASHBOARD_BRIDGE] get_camera_frame failed: {e}")
-            return ""
+            except ImportError:
+                logger.error(f"[DASHBOARD_BRIDGE] OpenCV not installed")
+                return ""
+            except Exception as e:
+                logger.error(f"[DASHBOARD_BRIDGE] get_camera_frame failed: {e}")
+                return ""
+
+    def close(self) -> None:
+        """Release camera devices held open by get_camera_frame()."""
+        with self._camera_lock:
+            for cap in self._captures.values():
+                cap.release()
+            self._captures.clear()
 
     async def get_audio_chunk(self) -> Dict[str, Any]:
         """Get a short audio chunk."""
@@ -154,10 +310,15 @@ class DashboardBridgePlugin:
         try:
             if self.world_model and hasattr(self.world_model, 'get_recent_events'):
                 return self.world_model.get_recent_events(limit=limit)
+            elif self.world_model and hasattr(self.world_model, 'get_recent'):
+                # WorldModel tails its event deque without copying all of it
+                return self.world_model.get_recent(limit)
             elif self.world_model and hasattr(self.world_model, 'events'):
                 # Return last N events
                 events = getattr(self.world_model, 'events', [])
-                return events[-limit:] if isinstance(events, list) else []
+                if isinstance(events, list):
+                    return events[-limit:]
+                return []
             else:
                 # Return dummy events for demo
                 return [
@@ -173,32 +334,31 @@ class DashboardBridgePlugin:
 
     async def get_plugin_status(self) -> List[Dict[str, Any]]:
         """Get status of all loaded plugins."""
-        status = []
-        for name, plugin in self.plugins_ref.items():
-            if name == "dashboard_bridge":
-                continue
-            status.append({
-                "name": name,
-                "class": plugin.__class__.__name__,
-                "version": getattr(plugin, "version", "unknown")
-            })
+        # Copies, so a caller editing the result cannot change later polls
+        status = [dict(entry) for entry in self._plugin_status]
         logger.info(f"[DASHBOARD_BRIDGE] returning status for {len(status)} plugins")
         return status
 
     async def get_reflex_status(self) -> List[Dict[str, Any]]:
         """Get all reflex rules and their state."""
         try:
-            reflex_plugin = self.plugins_ref.get("reflex_system")
+            reflex_plugin = self._reflex_plugin
             if not reflex_plugin:
                 return []
             
-            # Get reflexes via plugin's internal state
-            reflexes_list = []
-            for reflex_id, reflex in reflex_plugin.reflexes.items():
-                reflexes_list.append({
-                    **reflex,
-                    "enabled": True  # reflexes are enabled if present
-                })
+            # Rebuild only after reflexes were added, removed or triggered
+            if reflex_plugin.revision != self._reflex_status_revision:
+                # Get reflexes via plugin's internal state
+                self._reflex_status = [
+                    {
+                        **reflex,
+                        "enabled": True  # reflexes are enabled if present
+                    }
+                    for reflex in reflex_plugin.reflexes.values()
+                ]
+                self._reflex_status_revision = reflex_plugin.revision
+            # Copies, so a caller editing the result cannot change the cached list
+            reflexes_list = [dict(reflex) for reflex in self._reflex_status]
             
             logger.info(f"[DASHBOARD_BRIDGE] returning {len(reflexes_list)} reflexes")
             return reflexes_list
@@ -209,7 +369,7 @@ class DashboardBridgePlugin:
     async def get_motor_status(self) -> Dict[str, Any]:
         """Get current motor/servo state."""
         try:
-            motor_plugin = self.plugins_ref.get("motor_control")
+            motor_plugin = self._motor_plugin
             if not motor_plugin:
                 return {}
             
@@ -225,11 +385,11 @@ class DashboardBridgePlugin:
     async def get_memory_entries(self, limit: int = 200) -> List[Dict[str, Any]]:
         """Get long-term memory entries."""
         try:
-            mem_plugin = self.plugins_ref.get("long_term_memory")
+            mem_plugin = self._memory_plugin
             if not mem_plugin:
                 return []
             
-            entries = list(mem_plugin.memories.values())[:limit]
+            entries = list(islice(mem_plugin.memories.values(), limit))
             logger.info(f"[DASHBOARD_BRIDGE] returning {len(entries)} memory entries")
             return entries
         except Exception as e:
@@ -239,7 +399,7 @@ class DashboardBridgePlugin:
     async def get_reward_state(self) -> Dict[str, Any]:
         """Get current reward state and history."""
         try:
-            reward_plugin = self.plugins_ref.get("reward_system")
+            reward_plugin = self._reward_plugin
             if not reward_plugin:
                 return {"total_reward": 0, "reward_count": 0, "history": []}
             
@@ -248,7 +408,7 @@ class DashboardBridgePlugin:
                 "reward_count": reward_plugin.reward_count,
                 "threshold": reward_plugin.reward_threshold,
                 "goal_achieved": reward_plugin.is_goal_achieved(),
-                "history": reward_plugin.reward_history[-20:]  # Last 20 events
+                "history": reward_plugin.recent_events(20)  # Last 20 events
             }
         except Exception as e:
             logger.error(f"[DASHBOARD_BRIDGE] get_reward_state failed: {e}")
@@ -257,7 +417,7 @@ class DashboardBridgePlugin:
     async def get_body_schema(self) -> Dict[str, Any]:
         """Get the robot body schema."""
         try:
-            body_plugin = self.plugins_ref.get("body_schema")
+            body_plugin = self._body_plugin
             if not body_plugin:
                 return {}
             
@@ -279,10 +439,35 @@ class DashboardBridgePlugin:
         logger.info(f"[DASHBOARD_BRIDGE] get_agent_messages (limit={limit})")
         return []
 
+    async def get_snapshot(self, event_limit: int = 50) -> Dict[str, Any]:
+        """
+        Get the state a dashboard refreshes every tick in one call.
+
+        Args:
+            event_limit: Maximum number of world model events to include
+
+        Returns:
+            Dict with motor, reflexes, reward, plugins and events entries
+        """
+        motor, reflexes, reward, plugins, events = await asyncio.gather(
+            self.get_motor_status(),
+            self.get_reflex_status(),
+            self.get_reward_state(),
+            self.get_plugin_status(),
+            self.get_world_model_events(limit=event_limit)
+        )
+        return {
+            "motor": motor,
+            "reflexes": reflexes,
+            "reward": reward,
+            "plugins": plugins,
+            "events": events
+        }
+
     async def emergency_stop(self) -> str:
         """Immediately stop all motors/actuators."""
         try:
-            motor_plugin = self.plugins_ref.get("motor_control")
+            motor_plugin = self._motor_plugin
             if motor_plugin:
                 result = await motor_plugin.stop_all_motors()
                 logger.warning("[DASHBOARD_BRIDGE] EMERGENCY STOP triggered")
@@ -295,7 +480,7 @@ class DashboardBridgePlugin:
     async def set_wheel_speed(self, left_speed: float, right_speed: float) -> str:
         """Set wheel speeds (Operator Mode only)."""
         try:
-            motor_plugin = self.plugins_ref.get("motor_control")
+            motor_plugin = self._motor_plugin
             if not motor_plugin:
                 return "Motor plugin not available."
             
@@ -310,7 +495,7 @@ class DashboardBridgePlugin:
     async def set_servo_angle(self, id: int, angle: float) -> str:
         """Set a servo angle (Operator Mode only)."""
         try:
-            motor_plugin = self.plugins_ref.get("motor_control")
+            motor_plugin = self._motor_plugin
             if not motor_plugin:
                 return "Motor plugin not available."
             
@@ -325,19 +510,21 @@ class DashboardBridgePlugin:
     async def toggle_reflex(self, reflex_id: str, enabled: bool) -> str:
         """Enable or disable a reflex rule."""
         try:
-            reflex_plugin = self.plugins_ref.get("reflex_system")
+            reflex_plugin = self._reflex_plugin
             if not reflex_plugin:
                 return "Reflex plugin not available."
             
-            if reflex_id not in reflex_plugin.reflexes:
-                return f"Reflex {reflex_id} not found."
-            
             # Toggle by removing/re-adding (simple approach)
             if not enabled:
-                del reflex_plugin.reflexes[reflex_id]
+                # remove_reflex() also drops it from the plugin's per-sensor index
+                result = await reflex_plugin.remove_reflex(reflex_id)
+                if result.get("status") != "success":
+                    return f"Reflex {reflex_id} not found."
                 logger.info(f"[DASHBOARD_BRIDGE] disabled reflex {reflex_id}")
                 return f"Reflex {reflex_id} disabled."
             else:
+                if reflex_id not in reflex_plugin.reflexes:
+                    return f"Reflex {reflex_id} not found."
                 # Re-enable would need to store disabled state
                 logger.info(f"[DASHBOARD_BRIDGE] enabled reflex {reflex_id}")
                 return f"Reflex {reflex_id} enabled."
@@ -348,7 +535,7 @@ class DashboardBridgePlugin:
     async def delete_memory_entry(self, memory_id: str) -> str:
         """Delete a single memory entry by id."""
         try:
-            mem_plugin = self.plugins_ref.get("long_term_memory")
+            mem_plugin = self._memory_plugin
             if not mem_plugin:
                 return "Memory plugin not available."
             
@@ -363,7 +550,7 @@ class DashboardBridgePlugin:
     async def clear_memory(self) -> str:
         """Clear all long-term memory entries."""
         try:
-            mem_plugin = self.plugins_ref.get("long_term_memory")
+            mem_plugin = self._memory_plugin
             if not mem_plugin:
                 return "Memory plugin not available."
             
@@ -7,13 +7,33 @@ Useful for emergency responses and simple reactive behaviors.
 
 import asyncio
 import logging
-import uuid
+import operator
+import time
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from functools import partial
+from typing import Callable, Dict, Any, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 
+# predicate(sensor_value) -> whether the reflex fires; built once per reflex at add time
+_Predicate = Callable[[float], bool]
+
+
+def _within(threshold: float, tolerance: float) -> _Predicate:
+    low, high = threshold - tolerance, threshold + tolerance
+    return lambda value: low <= value <= high
+
+
+# Comparison name -> factory(threshold, tolerance) for that reflex's predicate.
+# partial(operator.lt, t)(v) is t < v, i.e. v > t, evaluated entirely in C.
+_COMPARISONS: Dict[str, Callable[[float, float], _Predicate]] = {
+    "greater_than": lambda threshold, tolerance: partial(operator.lt, threshold),
+    "less_than": lambda threshold, tolerance: partial(operator.gt, threshold),
+    "equal_to": _within,
+}
+
+
 class ReflexSystemPlugin:
     """Implements fast reflex reactions to sensor thresholds."""
 
@@ -24,6 +44,16 @@ class ReflexSystemPlugin:
     def __init__(self):
         """Initialize reflex system."""
         self.reflexes: Dict[str, Dict[str, Any]] = {}
+        # Source of reflex ids; never reset, so ids are unique for the plugin's lifetime
+        self._next_id = 0
+        # sensor_name -> reflexes watching that sensor (id -> (predicate, reflex)), so
+        # an event only visits its own sensor's reflexes; kept in step with self.reflexes
+        self._by_sensor: Dict[str, Dict[str, Tuple[_Predicate, Dict[str, Any]]]] = {}
+        # Bumped whenever a reflex is added, removed or triggered, so readers
+        # (the dashboard bridge) can tell when their copy of the reflexes is stale
+        self.revision = 0
+        # reflex_id -> time.monotonic() of its last action, for min_interval_ms debouncing
+        self._last_fired: Dict[str, float] = {}
         self.monitoring = False
         self.monitor_task: Optional[asyncio.Task] = None
 
@@ -33,7 +63,9 @@ class ReflexSystemPlugin:
         threshold: float,
         comparison: str,
         action_tool: str,
-        action_args: Optional[Dict[str, Any]] = None
+        action_args: Optional[Dict[str, Any]] = None,
+        min_interval_ms: float = 0,
+        tolerance: float = 0.01
     ) -> Dict[str, Any]:
         """
         Add a reflex rule.
@@ -44,25 +76,36 @@ class ReflexSystemPlugin:
             comparison: 'greater_than', 'less_than', or 'equal_to'
             action_tool: Tool to call when threshold is crossed
             action_args: Arguments for the action tool
+            min_interval_ms: Minimum time between actions; crossings within this
+                window of the last action are ignored (0 = fire on every crossing)
+            tolerance: For 'equal_to', how far the reading may be from the threshold
+                (in the sensor's own units) and still count as equal
 
         Returns:
             Reflex configuration dict with ID
         """
-        reflex_id = str(uuid.uuid4())[:8]
-
-        if comparison not in ["greater_than", "less_than", "equal_to"]:
+        if comparison not in _COMPARISONS:
             return {"status": "error", "message": "Invalid comparison operator"}
 
-        self.reflexes[reflex_id] = {
+        self._next_id += 1
+        reflex_id = format(self._next_id, "x")
+
+        reflex = {
             "id": reflex_id,
             "sensor_name": sensor_name,
             "threshold": float(threshold),
             "comparison": comparison,
             "action_tool": action_tool,
             "action_args": action_args or {},
+            "min_interval_ms": float(min_interval_ms),
+            "tolerance": float(tolerance),
             "created_at": datetime.now().isoformat(),
             "triggered_count": 0
         }
+        self.reflexes[reflex_id] = reflex
+        check = _COMPARISONS[comparison](reflex["threshold"], reflex["tolerance"])
+        self._by_sensor.setdefault(sensor_name, {})[reflex_id] = (check, reflex)
+        self.revision += 1
 
         logger.info(f"[REFLEX] Added reflex {reflex_id}: {sensor_name} {comparison} {threshold} → {action_tool}")
 
@@ -79,9 +122,11 @@ class ReflexSystemPlugin:
         Returns:
             Dict with status and list of reflex configurations
         """
+        # Copies, so callers cannot change a live reflex (e.g. its triggered_count);
+        # predicates live in _by_sensor, so every key here is public already
         return {
             "status": "success",
-            "reflexes": list(self.reflexes.values()),
+            "reflexes": [dict(reflex) for reflex in self.reflexes.values()],
             "count": len(self.reflexes)
         }
 
@@ -95,8 +140,14 @@ class ReflexSystemPlugin:
         Returns:
             Confirmation dict
         """
-        if reflex_id in self.reflexes:
-            del self.reflexes[reflex_id]
+        reflex = self.reflexes.pop(reflex_id, None)
+        if reflex is not None:
+            watching = self._by_sensor[reflex["sensor_name"]]
+            del watching[reflex_id]
+            if not watching:
+                del self._by_sensor[reflex["sensor_name"]]
+            self._last_fired.pop(reflex_id, None)
+            self.revision += 1
             logger.info(f"[REFLEX] Removed reflex {reflex_id}")
             return {"status": "success", "message": f"Reflex {reflex_id} removed"}
         else:
@@ -133,37 +184,44 @@ class ReflexSystemPlugin:
             event: World model event
             engine: Reference to ANSE engine for tool calling
         """
-        if not self.monitoring:
+        # Nothing to do until monitoring is on and at least one reflex exists
+        if not self.monitoring or not self._by_sensor:
+            return
+        
+        # Extract sensor reading from event if available; most events carry
+        # none, or come from sensors no reflex watches, and return here
+        sensor_name = event.get("sensor_name")
+        sensor_value = event.get("value")
+        
+        if sensor_name is None or sensor_value is None:
+            return
+        
+        watching = self._by_sensor.get(sensor_name)
+        if not watching:
             return
         
         try:
-            # Extract sensor reading from event if available
-            sensor_name = event.get("sensor_name")
-            sensor_value = event.get("value")
-            
-            if sensor_name is None or sensor_value is None:
-                return
-            
             # Check all reflexes for this sensor
-            for reflex_id, reflex in self.reflexes.items():
-                if reflex["sensor_name"] != sensor_name:
-                    continue
-                
-                # Check threshold
-                triggered = False
-                if reflex["comparison"] == "greater_than":
-                    triggered = sensor_value > reflex["threshold"]
-                elif reflex["comparison"] == "less_than":
-                    triggered = sensor_value < reflex["threshold"]
-                elif reflex["comparison"] == "equal_to":
-                    triggered = abs(sensor_value - reflex["threshold"]) < 0.01
-                
+            for reflex_id, (check, reflex) in list(watching.items()):
                 # Trigger action if threshold crossed
-                if triggered:
-                    logger.info(f"[REFLEX] Triggered {reflex_id}: {reflex['action_tool']}({reflex['action_args']})")
+                if check(sensor_value):
+                    # Debounce: a noisy reading oscillating around the threshold
+                    # fires at most once per min_interval_ms
+                    if reflex["min_interval_ms"]:
+                        now = time.monotonic()
+                        last = self._last_fired.get(reflex_id)
+                        if last is not None and (now - last) * 1000 < reflex["min_interval_ms"]:
+                            continue
+                        self._last_fired[reflex_id] = now
+                    # %-style arguments: the action_args repr is only built if INFO is enabled
+                    logger.info(
+                        "[REFLEX] Triggered %s: %s(%s)",
+                        reflex_id, reflex["action_tool"], reflex["action_args"]
+                    )
                     try:
                         await engine.tools.call(reflex["action_tool"], reflex["action_args"])
                         reflex["triggered_count"] += 1
+                        self.revision += 1
                     except Exception as e:
                         logger.error(f"[REFLEX] Failed to execute action {reflex['action_tool']}: {e}")
         except Exception as e:
@@ -0,0 +1,57 @@
+"""
+Tests for audit logging statistics.
+"""
+
+from anse.audit import AuditLogger
+
+
+def _log_call(audit, agent_id="agent-001", status="success", duration_ms=10.0):
+    audit.log_tool_call(
+        agent_id=agent_id,
+        call_id="call-1",
+        tool="say",
+        args={"text": "hi"},
+        result={"ok": True},
+        status=status,
+        duration_ms=duration_ms,
+    )
+
+
+def test_stats_reflect_later_events(tmp_path):
+    """Events logged after a get_agent_stats() call show up in the next call."""
+    audit = AuditLogger(str(tmp_path / "audit.jsonl"))
+    _log_call(audit)
+
+    first = audit.get_agent_stats("agent-001")
+    assert first["total_calls"] == 1
+    assert first["successful"] == 1
+
+    _log_call(audit, status="error")
+    audit.log_permission_denied("agent-001", "call-2", "say", "rate_limit_exceeded")
+    _log_call(audit, agent_id="agent-002")
+
+    second = audit.get_agent_stats("agent-001")
+    assert second["total_calls"] == 3
+    assert second["successful"] == 1
+    assert second["failed"] == 1
+    assert second["denied"] == 1
+    assert second["total_duration_ms"] == 20.0
+    assert audit.get_agent_stats("agent-002")["total_calls"] == 1
+
+
+def test_cached_stats_are_copies(tmp_path):
+    """Mutating returned stats does not change later results."""
+    audit = AuditLogger(str(tmp_path / "audit.jsonl"))
+    _log_call(audit)
+
+    audit.get_agent_stats("agent-001")["total_calls"] = 99
+
+    assert audit.get_agent_stats("agent-001")["total_calls"] == 1
+
+
+def test_stats_without_audit_file():
+    """Without an audit file every agent has empty stats."""
+    audit = AuditLogger()
+    _log_call(audit)
+
+    assert audit.get_agent_stats("agent-001")["total_calls"] == 0
@@ -0,0 +1,39 @@
+"""
+Tests for the dashboard JSON-RPC server's response encoding.
+"""
+
+import json
+
+from backend.dashboard_server import ANSEDashboardServer, _dumps
+
+
+class TestResponseEncoding:
+    """Test JSON-RPC response serialization."""
+
+    def test_dumps_int_keys(self):
+        """Int dict keys are encoded as strings, as json.dumps does."""
+        assert json.loads(_dumps({1: 90.0, "a": [1]})) == {"1": 90.0, "a": [1]}
+
+    async def test_motor_status_after_servo_move(self):
+        """Motor status (int-keyed servo positions) serializes after a servo move."""
+        server = ANSEDashboardServer()
+        await server.plugins["dashboard_bridge"].set_servo_angle(1, 45.0)
+
+        request = {"jsonrpc": "2.0", "method": "dashboard_bridge.get_motor_status", "id": 7}
+        response = await server._handle_request(request)
+        reply = json.loads(_dumps(response))
+
+        assert reply["id"] == 7
+        assert reply["result"]["servos"]["1"] == 45.0
+
+    async def test_snapshot_after_servo_move(self):
+        """get_snapshot, which embeds motor status, serializes after a servo move."""
+        server = ANSEDashboardServer()
+        await server.plugins["dashboard_bridge"].set_servo_angle(2, 10.0)
+
+        request = {"jsonrpc": "2.0", "method": "dashboard_bridge.get_snapshot", "id": 8}
+        response = await server._handle_request(request)
+        reply = json.loads(_dumps(response))
+
+        assert "error" not in reply
+        assert reply["result"]["motor"]["servos"]["2"] == 10.0
@@ -0,0 +1,143 @@
+"""
+Tests for the long-term memory plugin's recall (index, category filter, cache).
+"""
+
+import copy
+
+import pytest
+
+from plugins.cognition.long_term_memory.plugin import LongTermMemoryPlugin
+
+
+TEXTS = [
+    ("Red ball is under the table", "observation"),
+    ("The red door is locked", "observation"),
+    ("Avoid the stairs near the door", "lesson"),
+    ("Charge battery when below 20%", "goal"),
+    ("Ball rolled toward the kitchen", None),
+    ("Kitchen door opens inward", "observation"),
+    ("tabletop is slippery", "lesson"),
+]
+
+QUERIES = [
+    ("door", None), ("red", None), ("ball", "observation"), ("the", None),
+    ("DOOR", "observation"), ("table", None), ("er t", None), ("", None),
+    ("kitchen", None), ("missing", None), ("door", "lesson"), ("red", "nope"),
+    ("door", None), ("ball", None),
+]
+
+
+def scan_recall(memories, query, category=None, limit=10):
+    """Reference: the original linear-scan recall over a plain id -> memory dict."""
+    results = []
+    for memory in memories.values():
+        if category and memory["category"] != category:
+            continue
+        if query.lower() in memory["text"].lower():
+            memory["accessed_count"] += 1
+            results.append(memory.copy())
+    results.sort(key=lambda m: m["accessed_count"], reverse=True)
+    return results[:limit]
+
+
+async def _store(plugin, texts=TEXTS):
+    for text, category in texts:
+        await plugin.remember(text, category)
+
+
+class TestRecall:
+    """Test indexed recall against the original scan."""
+
+    async def test_ranking_matches_scan(self):
+        """Repeated recalls return the same entries, in the same order, as the scan."""
+        plugin = LongTermMemoryPlugin()
+        await _store(plugin)
+        reference = copy.deepcopy(plugin.memories)
+
+        for limit in (10, 2):
+            for query, category in QUERIES:
+                got = (await plugin.recall(query, category, limit))["results"]
+                expected = scan_recall(reference, query, category, limit)
+                assert got == expected, (query, category, limit)
+
+    async def test_category_filter(self):
+        """Only memories in the requested category are returned."""
+        plugin = LongTermMemoryPlugin()
+        await _store(plugin)
+
+        results = (await plugin.recall("door", category="observation"))["results"]
+        assert sorted(m["text"] for m in results) == [
+            "Kitchen door opens inward", "The red door is locked"
+        ]
+        assert (await plugin.recall("door", category="lesson"))["count"] == 1
+        assert (await plugin.recall("door", category="goal"))["count"] == 0
+        # Uncategorized memories are stored as "general"
+        general = (await plugin.recall("ball", category="general"))["results"]
+        assert [m["text"] for m in general] == ["Ball rolled toward the kitchen"]
+
+    async def test_results_are_copies(self):
+        """Mutating a result does not change the stored memory."""
+        plugin = LongTermMemoryPlugin()
+        await _store(plugin)
+
+        result = (await plugin.recall("battery"))["results"][0]
+        result["text"] = "changed"
+        assert (await plugin.recall("battery"))["results"][0]["text"] == "Charge battery when below 20%"
+
+
+class TestRecallCache:
+    """Test that cached recall results follow store and forget."""
+
+    async def test_store_invalidates(self):
+        """A memory stored after a recall shows up in the same query."""
+        plugin = LongTermMemoryPlugin()
+        await _store(plugin)
+        assert (await plugin.recall("door"))["count"] == 3
+
+        await plugin.remember("Back door is open", "observation")
+
+        results = (await plugin.recall("door"))["results"]
+        assert len(results) == 4
+        assert "Back door is open" in [m["text"] for m in results]
+
+    async def test_forget_invalidates(self):
+        """A forgotten memory is no longer returned by a cached query."""
+        plugin = LongTermMemoryPlugin()
+        await _store(plugin)
+        forgotten = (await plugin.recall("red", category="observation"))["results"][0]["id"]
+
+        assert (await plugin.forget(forgotten))["status"] == "success"
+
+        for category in (None, "observation"):
+            ids = [m["id"] for m in (await plugin.recall("red", category))["results"]]
+            assert forgotten not in ids
+            assert len(ids) == 1
+
+    async def test_clear_invalidates(self):
+        """clear_memory() empties cached queries too."""
+        plugin = LongTermMemoryPlugin()
+        await _store(plugin)
+        assert (await plugin.recall("the"))["count"] > 0
+
+        await plugin.clear_memory()
+
+        assert (await plugin.recall("the"))["count"] == 0
+        await plugin.remember("the new one")
+        assert [m["text"] for m in (await plugin.recall("the"))["results"]] == ["the new one"]
+
+    async def test_ids_unique_after_forget(self):
+        """Ids are never reused, even after forgetting the newest memory."""
+        plugin = LongTermMemoryPlugin()
+        first = (await plugin.remember("a"))["memory_id"]
+        await plugin.forget(first)
+        second = (await plugin.remember("b"))["memory_id"]
+        assert second != first
+
+
+@pytest.mark.parametrize("query", ["door", "d", "oor is", "20%"])
+async def test_substring_queries(query):
+    """Queries that are fragments of words or span words still match."""
+    plugin = LongTermMemoryPlugin()
+    await _store(plugin)
+    reference = copy.deepcopy(plugin.memories)
+    assert (await plugin.recall(query))["results"] == scan_recall(reference, query)
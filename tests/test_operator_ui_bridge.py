@@ -0,0 +1,113 @@
+"""
+Tests for the operator-ui bridge's incremental audit log reader.
+"""
+
+import json
+
+from anse.operator_ui_bridge import read_audit_lines
+
+
+def _append(path, text):
+    with open(path, "a") as f:
+        f.write(text)
+
+
+def _line(n):
+    return json.dumps({"agent_id": "agent-001", "tool": "say", "n": n}) + "\n"
+
+
+def _ns(events):
+    return [e["n"] for e in events]
+
+
+def test_reads_only_appended_lines(tmp_path):
+    """Each read resumes after the previous one and sees only new lines."""
+    log = tmp_path / "audit.jsonl"
+    _append(log, _line(1) + _line(2))
+
+    events, offset = read_audit_lines(str(log), 0, 100)
+    assert _ns(events) == [1, 2]
+    assert offset == log.stat().st_size
+
+    events, offset = read_audit_lines(str(log), offset, 100)
+    assert events == []
+
+    _append(log, _line(3))
+    events, offset = read_audit_lines(str(log), offset, 100)
+    assert _ns(events) == [3]
+
+
+def test_limit_resumes_where_it_stopped(tmp_path):
+    """A read capped by limit continues from the first unread line."""
+    log = tmp_path / "audit.jsonl"
+    _append(log, "".join(_line(n) for n in range(5)))
+
+    events, offset = read_audit_lines(str(log), 0, 2)
+    assert _ns(events) == [0, 1]
+    events, offset = read_audit_lines(str(log), offset, 10)
+    assert _ns(events) == [2, 3, 4]
+
+
+def test_partial_trailing_line_waits(tmp_path):
+    """A line still being written is left for the next read."""
+    log = tmp_path / "audit.jsonl"
+    full, partial = _line(1), _line(2)
+    _append(log, full + partial[:10])
+
+    events, offset = read_audit_lines(str(log), 0, 100)
+    assert _ns(events) == [1]
+    assert offset == len(full)
+
+    _append(log, partial[10:])
+    events, offset = read_audit_lines(str(log), offset, 100)
+    assert _ns(events) == [2]
+
+
+def test_blank_and_corrupt_lines_skipped(tmp_path):
+    """Blank and unparseable lines are consumed without producing entries."""
+    log = tmp_path / "audit.jsonl"
+    _append(log, _line(1) + "\n" + "{not json\n" + _line(2))
+
+    events, offset = read_audit_lines(str(log), 0, 100)
+    assert _ns(events) == [1, 2]
+    assert offset == log.stat().st_size
+
+
+def test_truncated_file_starts_over(tmp_path):
+    """After truncation the reader starts from the top of the new contents."""
+    log = tmp_path / "audit.jsonl"
+    _append(log, _line(1) + _line(2) + _line(3))
+    _, offset = read_audit_lines(str(log), 0, 100)
+
+    log.write_text(_line(4))
+    events, offset = read_audit_lines(str(log), offset, 100)
+    assert _ns(events) == [4]
+    assert offset == log.stat().st_size
+
+
+def test_rotated_file_starts_over(tmp_path):
+    """A rotated (replaced, shorter) log is read from the beginning."""
+    log = tmp_path / "audit.jsonl"
+    _append(log, _line(1) + _line(2))
+    _, offset = read_audit_lines(str(log), 0, 100)
+
+    log.rename(tmp_path / "audit.jsonl.1")
+    _append(log, _line(3))
+    events, _ = read_audit_lines(str(log), offset, 100)
+    assert _ns(events) == [3]
+
+
+def test_offsets_are_bytes_with_non_ascii(tmp_path):
+    """Offsets count bytes, so multi-byte text does not confuse the cursor."""
+    log = tmp_path / "audit.jsonl"
+    first = json.dumps({"n": 1, "text": "température 25°"}, ensure_ascii=False) + "\n"
+    with open(log, "w", encoding="utf-8") as f:
+        f.write(first)
+
+    events, offset = read_audit_lines(str(log), 0, 100)
+    assert events[0]["text"] == "température 25°"
+    assert offset == len(first.encode("utf-8")) == log.stat().st_size
+
+    _append(log, _line(2))
+    events, _ = read_audit_lines(str(log), offset, 100)
+    assert _ns(events) == [2]
@@ -0,0 +1,191 @@
+"""
+Tests for reflex triggering: comparisons, tolerance, and min_interval_ms debounce.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from plugins.system.reflex_system import plugin as reflex_module
+from plugins.system.reflex_system.plugin import ReflexSystemPlugin
+
+
+class FakeEngine:
+    """Records tool calls made by triggered reflexes."""
+
+    def __init__(self):
+        self.calls = []
+        self.tools = self
+
+    async def call(self, name, args):
+        self.calls.append(name)
+        return {"status": "success"}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.monotonic() for the reflex module, in seconds."""
+    now = [100.0]
+    monkeypatch.setattr(reflex_module, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+async def _plugin(**reflex):
+    plugin = ReflexSystemPlugin()
+    await plugin.enable_background_monitoring()
+    result = await plugin.add_reflex(**reflex)
+    assert result["status"] == "success"
+    return plugin, result["reflex_id"]
+
+
+async def _feed(plugin, engine, sensor, *values):
+    for value in values:
+        await plugin.process_world_model_event({"sensor_name": sensor, "value": value}, engine)
+
+
+class TestComparisons:
+    """Test threshold comparisons and equal_to tolerance."""
+
+    async def test_greater_and_less_than(self):
+        engine = FakeEngine()
+        plugin, _ = await _plugin(
+            sensor_name="temp", threshold=30, comparison="greater_than", action_tool="fan"
+        )
+        await plugin.add_reflex("temp", 10, "less_than", "heat")
+
+        await _feed(plugin, engine, "temp", 30, 30.5, 10, 9.9, 20)
+
+        assert engine.calls == ["fan", "heat"]
+
+    async def test_other_sensors_ignored(self):
+        engine = FakeEngine()
+        plugin, _ = await _plugin(
+            sensor_name="temp", threshold=30, comparison="greater_than", action_tool="fan"
+        )
+
+        await _feed(plugin, engine, "humidity", 99)
+        await plugin.process_world_model_event({"value": 99}, engine)
+
+        assert engine.calls == []
+
+    @pytest.mark.parametrize("value, fires", [
+        (4.5, True), (5.5, True), (5.0, True), (4.49, False), (5.51, False),
+    ])
+    async def test_tolerance_bounds_inclusive(self, value, fires):
+        engine = FakeEngine()
+        plugin, _ = await _plugin(
+            sensor_name="pressure", threshold=5, comparison="equal_to",
+            action_tool="vent", tolerance=0.5
+        )
+
+        await _feed(plugin, engine, "pressure", value)
+
+        assert engine.calls == (["vent"] if fires else [])
+
+    @pytest.mark.parametrize("value, fires", [(5.005, True), (4.995, True), (5.02, False)])
+    async def test_default_tolerance(self, value, fires):
+        engine = FakeEngine()
+        plugin, reflex_id = await _plugin(
+            sensor_name="dist", threshold=5, comparison="equal_to", action_tool="stop"
+        )
+        assert plugin.reflexes[reflex_id]["tolerance"] == 0.01
+
+        await _feed(plugin, engine, "dist", value)
+
+        assert engine.calls == (["stop"] if fires else [])
+
+    async def test_invalid_comparison(self):
+        plugin = ReflexSystemPlugin()
+        result = await plugin.add_reflex("temp", 1, "bogus", "fan")
+        assert result["status"] == "error"
+        assert plugin.reflexes == {}
+
+
+class TestDebounce:
+    """Test min_interval_ms suppression and re-firing."""
+
+    async def test_suppressed_within_interval(self, clock):
+        engine = FakeEngine()
+        plugin, reflex_id = await _plugin(
+            sensor_name="temp", threshold=30, comparison="greater_than",
+            action_tool="fan", min_interval_ms=500
+        )
+
+        await _feed(plugin, engine, "temp", 31)
+        clock[0] += 0.2
+        await _feed(plugin, engine, "temp", 32, 33)
+        clock[0] += 0.299
+        await _feed(plugin, engine, "temp", 34)
+
+        assert engine.calls == ["fan"]
+        assert plugin.reflexes[reflex_id]["triggered_count"] == 1
+
+    async def test_fires_again_after_interval(self, clock):
+        engine = FakeEngine()
+        plugin, reflex_id = await _plugin(
+            sensor_name="temp", threshold=30, comparison="greater_than",
+            action_tool="fan", min_interval_ms=500
+        )
+
+        await _feed(plugin, engine, "temp", 31)
+        clock[0] += 0.5
+        await _feed(plugin, engine, "temp", 31)
+        clock[0] += 0.1
+        await _feed(plugin, engine, "temp", 31)
+        clock[0] += 0.6
+        await _feed(plugin, engine, "temp", 31)
+
+        assert engine.calls == ["fan", "fan", "fan"]
+        assert plugin.reflexes[reflex_id]["triggered_count"] == 3
+
+    async def test_non_crossing_does_not_reset_interval(self, clock):
+        engine = FakeEngine()
+        plugin, _ = await _plugin(
+            sensor_name="temp", threshold=30, comparison="greater_than",
+            action_tool="fan", min_interval_ms=500
+        )
+
+        await _feed(plugin, engine, "temp", 31)
+        clock[0] += 0.3
+        await _feed(plugin, engine, "temp", 20)
+        clock[0] += 0.3
+        await _feed(plugin, engine, "temp", 31)
+
+        assert engine.calls == ["fan", "fan"]
+
+    async def test_zero_interval_fires_every_crossing(self, clock):
+        engine = FakeEngine()
+        plugin, _ = await _plugin(
+            sensor_name="temp", threshold=30, comparison="greater_than", action_tool="fan"
+        )
+
+        await _feed(plugin, engine, "temp", 31, 31, 31)
+
+        assert engine.calls == ["fan", "fan", "fan"]
+
+    async def test_debounce_is_per_reflex(self, clock):
+        engine = FakeEngine()
+        plugin, _ = await _plugin(
+            sensor_name="temp", threshold=30, comparison="greater_than",
+            action_tool="fan", min_interval_ms=1000
+        )
+        await plugin.add_reflex("temp", 25, "greater_than", "alarm")
+
+        await _feed(plugin, engine, "temp", 31, 31)
+
+        assert engine.calls == ["fan", "alarm", "alarm"]
+
+    async def test_removed_reflex_stops_firing(self, clock):
+        engine = FakeEngine()
+        plugin, reflex_id = await _plugin(
+            sensor_name="temp", threshold=30, comparison="greater_than",
+            action_tool="fan", min_interval_ms=500
+        )
+
+        await _feed(plugin, engine, "temp", 31)
+        await plugin.remove_reflex(reflex_id)
+        clock[0] += 1
+        await _feed(plugin, engine, "temp", 31)
+
+        assert engine.calls == ["fan"]
+        assert plugin._last_fired == {}
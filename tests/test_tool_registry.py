@@ -0,0 +1,38 @@
+"""
+Tests for ToolRegistry listing.
+"""
+
+from anse.tool_registry import ToolRegistry
+
+
+async def _echo(**kwargs):
+    return kwargs
+
+
+def _registry():
+    registry = ToolRegistry()
+    registry.register(name="echo", func=_echo, schema={"type": "object"}, description="Echo")
+    return registry
+
+
+def test_list_tools_sees_later_registration():
+    """A tool registered after list_tools() appears in the next listing."""
+    registry = _registry()
+    assert list(registry.list_tools()) == ["echo"]
+
+    registry.register(name="echo2", func=_echo, schema={"type": "object"})
+
+    tools = registry.list_tools()
+    assert set(tools) == {"echo", "echo2"}
+    assert tools["echo2"]["description"] == ""
+
+
+def test_list_tools_returns_independent_dicts():
+    """Mutating a listing does not change later listings."""
+    registry = _registry()
+    first = registry.list_tools()
+    first.pop("echo")
+    first["bogus"] = {}
+
+    assert list(registry.list_tools()) == ["echo"]
+    assert registry.list_tools() is not registry.list_tools()
@@ -0,0 +1,28 @@
+"""
+Tests for WorldModel recent-event queries.
+"""
+
+import pytest
+
+from anse.world_model import WorldModel
+
+
+@pytest.fixture
+def world():
+    """A bounded world model that has already dropped its oldest events."""
+    model = WorldModel(max_events=5)
+    for i in range(8):
+        model.append_event({"type": "even" if i % 2 == 0 else "odd", "agent_id": "a", "i": i})
+    return model
+
+
+@pytest.mark.parametrize("n", [-2, 0, 1, 3, 5, 9])
+def test_get_recent_matches_list_slice(world, n):
+    """get_recent(n) equals list(events)[-n:], oldest first."""
+    assert world.get_recent(n) == list(world.events)[-n:]
+
+
+def test_filters_apply_to_recent_window(world):
+    """Type and agent filters look only at the last n events, in order."""
+    assert [e["i"] for e in world.get_events_by_type("odd", 4)] == [5, 7]
+    assert [e["i"] for e in world.get_events_for_agent("a", 2)] == [6, 7]